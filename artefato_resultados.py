@@ -0,0 +1,134 @@
+"""
+Artefato versionado com os resultados das observações (arrays em .npz e metadados em .json)
+
+Separa o cálculo (PipelineCabo) da apresentação (relatório PDF): o cálculo grava o artefato
+uma vez e o relatório pode ser gerado de novo a partir dele, quantas vezes for preciso, sem
+executar as etapas numéricas.
+
+Uso:
+    python artefato_resultados.py resultados            # calcula e grava resultados.npz/.json
+    python gerador_pdf.py --artefato resultados         # gera o PDF a partir do artefato
+"""
+
+import argparse
+import json
+import os
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from numpy.polynomial import Polynomial
+
+from cabo import ProblemaCabo
+
+# Incrementar quando o formato do artefato mudar; artefatos de outra versão são recusados
+VERSAO_ARTEFATO = 1
+
+# Arrays gravados no .npz: nome no arquivo -> (etapa, posição/chave no resultado da etapa)
+_ARRAYS = {
+    'T': ('obs1', 0),
+    'X': ('obs1', 1),
+    'y_prime_num': ('obs2', 2),
+    'y_double_prime_num': ('obs2', 3),
+    'erros_edo': ('obs2', 4),
+    'coeficientes': ('obs3', 'coeficientes'),
+}
+
+# Escalares da Obs.3 guardados nos metadados
+_ESCALARES_OBS3 = ('r_squared', 'erro_medio', 'erro_maximo')
+
+
+def salvar_artefato(pipeline, caminho_base: str) -> Tuple[str, str]:
+    """
+    Calcula todas as etapas do pipeline e grava o artefato em caminho_base.npz e caminho_base.json.
+
+    Argumentos:
+    pipeline (PipelineCabo): Pipeline cujos resultados são gravados (etapas já calculadas são reaproveitadas)
+    caminho_base (str): Caminho sem extensão
+
+    Retorna:
+    (str, str): Caminhos do .npz e do .json
+    """
+    resultados = pipeline.executar()
+    arrays = {nome: np.asarray(resultados[etapa][chave]) for nome, (etapa, chave) in _ARRAYS.items()}
+
+    metadados = {
+        'versao': VERSAO_ARTEFATO,
+        'criado_em': datetime.now().isoformat(timespec='seconds'),
+        'problema': asdict(pipeline.problema),
+        'obs3': {nome: float(resultados['obs3'][nome]) for nome in _ESCALARES_OBS3},
+    }
+
+    caminho_npz, caminho_json = f"{caminho_base}.npz", f"{caminho_base}.json"
+    diretorio = os.path.dirname(caminho_base)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+
+    # Grava em temporários e renomeia: um leitor nunca vê um .npz novo com um .json antigo pela metade
+    np.savez(f"{caminho_base}.tmp.npz", **arrays)
+    with open(f"{caminho_json}.tmp", 'w', encoding='utf-8') as arquivo:
+        json.dump(metadados, arquivo, indent=2, ensure_ascii=False)
+    os.replace(f"{caminho_base}.tmp.npz", caminho_npz)
+    os.replace(f"{caminho_json}.tmp", caminho_json)
+
+    return caminho_npz, caminho_json
+
+
+class ResultadosArtefato:
+    """
+    Resultados lidos de um artefato, com a mesma interface de leitura do PipelineCabo.
+
+    Pode substituir o pipeline nos consumidores (ex.: RelatorPDF): resultado(etapa) devolve as
+    mesmas estruturas que as etapas do pipeline, sem calcular nada.
+    """
+
+    def __init__(self, caminho_base: str):
+        """
+        Argumentos:
+        caminho_base (str): Caminho do artefato sem extensão (como em salvar_artefato)
+        """
+        with open(f"{caminho_base}.json", encoding='utf-8') as arquivo:
+            self.metadados: Dict[str, Any] = json.load(arquivo)
+        if self.metadados.get('versao') != VERSAO_ARTEFATO:
+            raise ValueError(f"Artefato {caminho_base} tem versão {self.metadados.get('versao')}, "
+                             f"esperada {VERSAO_ARTEFATO}")
+
+        with np.load(f"{caminho_base}.npz") as dados:
+            self._arrays = {nome: dados[nome] for nome in _ARRAYS}
+
+        self.problema = ProblemaCabo(**self.metadados['problema'])
+        self.instrumentacao = None
+
+    def resultado(self, etapa: str) -> Any:
+        """Resultado da etapa no mesmo formato de PipelineCabo.resultado"""
+        a = self._arrays
+        if etapa == 'obs1':
+            return a['T'], a['X']
+        if etapa == 'obs2':
+            return a['T'], a['X'], a['y_prime_num'], a['y_double_prime_num'], a['erros_edo']
+        if etapa == 'obs3':
+            return {
+                'x_data': a['T'],
+                'y_data': a['X'][0],
+                'polinomio': Polynomial(a['coeficientes'][::-1]),
+                'coeficientes': a['coeficientes'],
+                **self.metadados['obs3'],
+            }
+        raise KeyError(f"Etapa desconhecida: {etapa}")
+
+
+def main(argv: Optional[list] = None) -> None:
+    from cache_resultados import CacheResultados
+    from pipeline import PipelineCabo
+
+    parser = argparse.ArgumentParser(description="Calcula as observações e grava o artefato de resultados")
+    parser.add_argument('caminho', help="Caminho do artefato, sem extensão (gera .npz e .json)")
+    args = parser.parse_args(argv)
+
+    caminho_npz, caminho_json = salvar_artefato(PipelineCabo(cache=CacheResultados()), args.caminho)
+    print(f"Artefato gravado: {caminho_npz}, {caminho_json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Benchmarks dos solvers de EDO, da diferenciação numérica e da regressão polinomial
+
+Cada medição é impressa como uma linha JSON (JSON Lines), com tempo de parede, número de
+avaliações do lado direito da EDO, pico de memória alocada e erro em relação a uma referência,
+para acompanhar as curvas de escala em função do passo h e do tamanho do lote.
+
+Uso:
+    python benchmark.py                                  # todos os alvos, h de 1e-1 a 1e-5
+    python benchmark.py --alvos rk4 tiro --passos 1e-2 1e-3 --saida resultados.jsonl
+    python benchmark.py --alvos inicializacao            # tempo de inicialização dos pontos de entrada
+    python benchmark.py --alvos rigido --passos 1e-1 1e-3 1e-4  # explícito vs. implícitos em problema rígido
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List
+
+import numpy as np
+
+from cabo import ProblemaCabo
+from instrumentacao import ContadorChamadas
+from numerical_dif import NumericalDifferentiator
+from regressao import regressao_polinomial
+from solucao_analitica import SolucaoAnaliticaCabo
+from solvers_edo import SolverEDO
+
+PASSOS_PADRAO = [1e-1, 1e-2, 1e-3, 1e-4, 1e-5]
+LOTES_PADRAO = [1, 10, 100]
+ALVOS = ['rk1', 'rk2', 'rk4', 'tiro', 'diferenciacao', 'regressao', 'rigido', 'inicializacao']
+
+# Problema rígido de Prothero-Robinson x' = λ (x - cos t) - sin t, x(0) = 1 (solução x = cos t) em [0, 2]
+LAMBDA_RIGIDO = -1e4
+METODOS_RIGIDO = ['rk4', 'euler_implicito', 'trbdf2', 'rosenbrock']
+
+# Módulos cuja importação (interpretador novo) é medida pelo alvo 'inicializacao'
+MODULOS_INICIALIZACAO = ['main', 'pipeline', 'execucao_lote', 'gerador_pdf']
+
+# Bibliotecas pesadas que só devem ser carregadas quando gráficos ou o PDF forem de fato gerados
+MODULOS_PESADOS = ['matplotlib', 'reportlab', 'concurrent.futures.process']
+
+# y'(a) exato do problema do enunciado, usado como condição inicial dos PVIs
+INCLINACAO_INICIAL = float(SolucaoAnaliticaCabo.do_problema().dy(ProblemaCabo.a))
+
+
+def medir(executar: Callable, memoria: bool = True) -> Dict[str, float]:
+    """
+    Executa a função medindo o tempo de parede e, opcionalmente, o pico de memória.
+
+    O pico de memória é medido em uma segunda execução, com tracemalloc ativo, para que o custo
+    do rastreamento não entre no tempo medido.
+    """
+    inicio = time.perf_counter()
+    resultado = executar()
+    medicao = {'tempo_s': time.perf_counter() - inicio}
+
+    if memoria:
+        tracemalloc.start()
+        executar()
+        medicao['pico_memoria_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    medicao['resultado'] = resultado
+    return medicao
+
+
+def bench_rk(metodo: str, passos: List[float], lotes: List[int], memoria: bool) -> Iterator[dict]:
+    """PVI do cabo com y'(a) conhecido, para cada h e tamanho de lote"""
+    p = ProblemaCabo()
+    integrar = getattr(SolverEDO, metodo)
+
+    for h in passos:
+        T, _ = SolverEDO.malha(p.a, p.b, h)
+        referencia = SolucaoAnaliticaCabo.do_valor_inicial(p.C, p.a, p.y0, INCLINACAO_INICIAL)(p.b)
+
+        for k in lotes:
+            x0 = np.tile(np.array([[p.y0], [INCLINACAO_INICIAL]]), (1, k)) if k > 1 else np.array([p.y0, INCLINACAO_INICIAL])
+            f = ContadorChamadas(p.f)
+            medicao = medir(lambda: integrar(f, p.a, p.b, h, x0), memoria)
+            _, X = medicao.pop('resultado')
+            x_final = X[..., -1] if k == 1 else X[:, 0, -1]
+
+            yield {'alvo': metodo, 'h': h, 'lote': k, 'n_pontos': len(T), **medicao,
+                   'avaliacoes_f': f.chamadas // (2 if memoria else 1),
+                   'erro': float(np.max(np.abs(x_final - referencia)))}
+
+
+def bench_tiro(passos: List[float], memoria: bool) -> Iterator[dict]:
+    """Método do Tiro no problema do enunciado; erro em y'(a) e na condição de contorno"""
+    p = ProblemaCabo()
+
+    for h in passos:
+        T, _ = SolverEDO.malha(p.a, p.b, h)
+        referencia = float(SolucaoAnaliticaCabo.do_problema(p).dy(p.a))
+
+        f = ContadorChamadas(p.f)
+        medicao = medir(lambda: SolverEDO.tiro(f, p.a, p.b, h, p.y0, p.yb, p.chute1, p.chute2,
+                                                tol=p.tol, max_iter=p.max_iter), memoria)
+        _, X = medicao.pop('resultado')
+
+        yield {'alvo': 'tiro', 'h': h, 'lote': 1, 'n_pontos': len(T), **medicao,
+               'avaliacoes_f': f.chamadas // (2 if memoria else 1),
+               'erro': abs(X[1, 0] - referencia), 'erro_contorno': abs(X[0, -1] - p.yb)}
+
+
+def bench_diferenciacao(passos: List[float], memoria: bool) -> Iterator[dict]:
+    """Derivadas de sin(x) em [0, 20]; erro máximo da 1ª e da 2ª derivadas"""
+    for h in passos:
+        x = np.arange(0.0, 20.0 + h / 2, h)
+        y = np.sin(x)
+
+        medicao = medir(lambda: NumericalDifferentiator(y, h).calculate_derivatives(), memoria)
+        d1, d2 = medicao.pop('resultado')
+
+        yield {'alvo': 'diferenciacao', 'h': h, 'lote': 1, 'n_pontos': len(x), **medicao,
+               'erro': float(np.max(np.abs(d1 - np.cos(x)))), 'erro_d2': float(np.max(np.abs(d2 + np.sin(x))))}
+
+
+def bench_regressao(passos: List[float], memoria: bool) -> Iterator[dict]:
+    """Regressão polinomial sobre a solução do Tiro (a resolução do PVC não entra no tempo)"""
+    p = ProblemaCabo()
+
+    for h in passos:
+        solucao = SolverEDO.tiro(p.f, p.a, p.b, h, p.y0, p.yb, p.chute1, p.chute2, tol=p.tol, max_iter=p.max_iter)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            medicao = medir(lambda: regressao_polinomial(mostrar_graficos=False, problema=p, solucao=solucao), memoria)
+        resultado = medicao.pop('resultado')
+
+        yield {'alvo': 'regressao', 'h': h, 'lote': 1, 'n_pontos': len(solucao[0]), **medicao,
+               'erro': float(resultado['erro_medio']), 'r_squared': float(resultado['r_squared'])}
+
+
+def _f_rigido(t, x):
+    return LAMBDA_RIGIDO * (x - np.cos(t)) - np.sin(t)
+
+
+def bench_rigido(passos: List[float], memoria: bool) -> Iterator[dict]:
+    """
+    Problema rígido com o RK4 e com os métodos implícitos, para cada h. O RK4 só é estável com
+    h |λ| < 2,8; os implícitos (L-estáveis) aceitam qualquer h, e o erro depende só da precisão.
+    """
+    for metodo in METODOS_RIGIDO:
+        for h in passos:
+            T, _ = SolverEDO.malha(0.0, 2.0, h)
+            f = ContadorChamadas(_f_rigido)
+            info = {}
+
+            # Com h acima do limite de estabilidade o RK4 diverge até inf/nan: o erro registra isso
+            with np.errstate(over='ignore', invalid='ignore'):
+                medicao = medir(lambda: SolverEDO.integrar(f, 0.0, 2.0, h, np.array([1.0]), metodo, info=info), memoria)
+                _, X = medicao.pop('resultado')
+                erro = float(np.max(np.abs(X[0] - np.cos(T))))
+
+            yield {'alvo': 'rigido', 'metodo': metodo, 'h': h, 'lote': 1, 'n_pontos': len(T), **info, **medicao,
+                   'avaliacoes_f': f.chamadas // (2 if memoria else 1), 'erro': erro}
+
+
+def bench_inicializacao(repeticoes: int = 5) -> Iterator[dict]:
+    """
+    Tempo de parede para iniciar um interpretador e importar cada módulo (o custo pago por cada
+    chamada de um wrapper de lote), com a mediana de várias repetições e as bibliotecas pesadas carregadas.
+    """
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    codigo = ("import sys, json, {modulo}; "
+              f"print(json.dumps([m for m in {MODULOS_PESADOS!r} if m in sys.modules]))")
+
+    referencia = None
+    for modulo in [None] + MODULOS_INICIALIZACAO:
+        comando = [sys.executable, '-c', codigo.format(modulo=modulo) if modulo else 'pass']
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            saida = subprocess.run(comando, cwd=diretorio, capture_output=True, text=True, check=True).stdout
+            tempos.append(time.perf_counter() - inicio)
+
+        if modulo is None:
+            # Interpretador vazio: descontado para isolar o custo das importações
+            referencia = float(np.median(tempos))
+            continue
+
+        yield {'alvo': 'inicializacao', 'modulo': modulo, 'repeticoes': repeticoes,
+               'tempo_s': float(np.median(tempos)), 'tempo_min_s': min(tempos),
+               'tempo_importacao_s': float(np.median(tempos)) - referencia,
+               'pesados_carregados': json.loads(saida)}
+
+
+def executar_benchmarks(alvos: List[str], passos: List[float], lotes: List[int], memoria: bool = True) -> Iterator[dict]:
+    """Gera as medições de todos os alvos pedidos"""
+    for alvo in alvos:
+        if alvo in ('rk1', 'rk2', 'rk4'):
+            yield from bench_rk(alvo, passos, lotes, memoria)
+        elif alvo == 'tiro':
+            yield from bench_tiro(passos, memoria)
+        elif alvo == 'diferenciacao':
+            yield from bench_diferenciacao(passos, memoria)
+        elif alvo == 'regressao':
+            yield from bench_regressao(passos, memoria)
+        elif alvo == 'rigido':
+            yield from bench_rigido(passos, memoria)
+        elif alvo == 'inicializacao':
+            yield from bench_inicializacao()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos métodos numéricos (saída em JSON Lines)")
+    parser.add_argument('--alvos', nargs='+', choices=ALVOS, default=ALVOS, help="O que medir")
+    parser.add_argument('--passos', nargs='+', type=float, default=PASSOS_PADRAO, help="Valores de h")
+    parser.add_argument('--lotes', nargs='+', type=int, default=LOTES_PADRAO,
+                        help="Tamanhos de lote dos PVIs (rk1, rk2, rk4)")
+    parser.add_argument('--sem-memoria', action='store_true', help="Não mede o pico de memória (mais rápido)")
+    parser.add_argument('--saida', help="Arquivo .jsonl de saída (padrão: saída padrão)")
+    args = parser.parse_args(argv)
+
+    saida = open(args.saida, 'w', encoding='utf-8') if args.saida else sys.stdout
+    try:
+        for medicao in executar_benchmarks(args.alvos, args.passos, args.lotes, memoria=not args.sem_memoria):
+            saida.write(json.dumps(medicao) + "\n")
+            saida.flush()
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Definição do problema do cabo suspenso: d²y/dx² = C * sqrt(1 + (dy/dx)²), y(a) = y0, y(b) = yb
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ProblemaCabo:
+    """
+    Parâmetros do problema do cabo e do método do Tiro usado para resolvê-lo.
+
+    Os valores padrão são os do enunciado (Obs.1). Por ser imutável e serializável pelo pickle,
+    a instância (e o método f) pode ser enviada para outros processos.
+    """
+    C: float = 0.041        # Constante da EDO
+    a: float = 0.0          # Início do intervalo
+    b: float = 20           # Fim do intervalo
+    h: float = 0.01         # Passo de integração
+    y0: float = 15          # y(a)
+    yb: float = 10          # y(b)
+    chute1: float = -5      # Chute inicial para y'(a)
+    chute2: float = 10      # Segundo chute
+    tol: float = 1e-5       # Tolerância do método do Tiro
+    max_iter: int = 10      # Número máximo de iterações do método do Tiro
+    metodo: str = 'rk4'     # Integrador do Tiro: 'rk4', 'euler_implicito', 'trbdf2' ou 'rosenbrock'
+
+    def f(self, t, y2):
+        """Sistema de 1ª ordem equivalente: y' = w, w' = C * sqrt(1 + w²)"""
+        y, w = y2
+        dydx = w
+        dwdx = self.C * np.sqrt(1.0 + w**2)
+        return np.array([dydx, dwdx])
+
+    def f_inplace(self, t, y2, out):
+        """Mesmo sistema de f, escrevendo as derivadas em out (protocolo inplace de SolverEDO.rk4)"""
+        w = y2[1:2]                     # Fatia (e não índice) para obter uma view também em vetores 1-D
+        dwdx = out[1:2]
+        out[0] = y2[1]
+        np.multiply(w, w, out=dwdx)
+        dwdx += 1.0
+        np.sqrt(dwdx, out=dwdx)
+        dwdx *= self.C
+
+    def jac(self, t, y2):
+        """Jacobiana df/dy2 de f: (2, 2), ou (2, 2, k) para um lote de k estados (ver SolverEDO.integrar)"""
+        w = np.asarray(y2[1], dtype=float)
+        zero, um = np.zeros_like(w), np.ones_like(w)
+        return np.array([[zero, um], [zero, self.C * w / np.sqrt(1.0 + w**2)]])
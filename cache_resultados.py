@@ -0,0 +1,166 @@
+"""
+Cache em disco, endereçado por conteúdo, para soluções (T, X) de problemas de contorno
+
+Cada entrada fica em um diretório cujo nome é o hash SHA-256 da definição do problema e das
+configurações do solver. Os arrays são salvos em .npy e recarregados mapeados em memória.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Incrementar quando uma mudança nos solvers alterar os resultados, invalidando o cache antigo
+VERSAO_CACHE = 2
+
+
+class CacheResultados:
+    """
+    Cache persistente de soluções (T, X) com despejo LRU por tamanho total em disco.
+
+    O "último acesso" de uma entrada é a data de modificação do seu diretório, atualizada a cada
+    leitura; quando o tamanho total passa do limite, as entradas menos usadas são removidas.
+    """
+
+    def __init__(self, diretorio: str = ".cache_resultados", tamanho_max_bytes: int = 512 * 2**20):
+        """
+        Argumentos:
+        diretorio (str): Diretório onde as entradas são guardadas (criado se não existir)
+        tamanho_max_bytes (int): Tamanho total máximo das entradas antes do despejo
+        """
+        if tamanho_max_bytes <= 0:
+            raise ValueError("tamanho_max_bytes deve ser positivo")
+
+        self.diretorio = diretorio
+        self.tamanho_max_bytes = tamanho_max_bytes
+        os.makedirs(diretorio, exist_ok=True)
+
+    @staticmethod
+    def chave(**definicao: Any) -> str:
+        """
+        Calcula a chave (hash SHA-256) de uma definição de problema e solver.
+
+        Os valores devem ser serializáveis em JSON (números, textos, listas e dicionários).
+        """
+        conteudo = json.dumps({'versao': VERSAO_CACHE, **definicao}, sort_keys=True, default=repr)
+        return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+
+    def obter(self, chave: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Retorna (T, X) mapeados em memória (somente leitura), ou None se a chave não estiver no cache"""
+        caminho = self._caminho(chave)
+        try:
+            T = np.load(os.path.join(caminho, "T.npy"), mmap_mode='r')
+            X = np.load(os.path.join(caminho, "X.npy"), mmap_mode='r')
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # Marca o acesso para a política LRU
+        os.utime(caminho)
+        return T, X
+
+    def salvar(self, chave: str, T: np.ndarray, X: np.ndarray, metadados: Optional[Dict[str, Any]] = None) -> None:
+        """Guarda (T, X) sob a chave e despeja entradas antigas se o limite de tamanho for excedido"""
+        # Escreve em um diretório temporário e renomeia: leitores nunca veem uma entrada incompleta
+        temporario = tempfile.mkdtemp(dir=self.diretorio, prefix=".tmp-")
+        try:
+            np.save(os.path.join(temporario, "T.npy"), np.asarray(T))
+            np.save(os.path.join(temporario, "X.npy"), np.asarray(X))
+            with open(os.path.join(temporario, "meta.json"), "w", encoding="utf-8") as arquivo:
+                json.dump({'criado_em': time.time(), **(metadados or {})}, arquivo, default=repr)
+
+            self.invalidar(chave)
+            os.replace(temporario, self._caminho(chave))
+        except BaseException:
+            shutil.rmtree(temporario, ignore_errors=True)
+            raise
+
+        self._despejar(manter=chave)
+
+    def invalidar(self, chave: str) -> bool:
+        """Remove a entrada da chave; retorna True se ela existia"""
+        caminho = self._caminho(chave)
+        if not os.path.isdir(caminho):
+            return False
+        shutil.rmtree(caminho)
+        return True
+
+    def limpar(self) -> None:
+        """Remove todas as entradas do cache"""
+        for chave, _, _ in self._entradas():
+            self.invalidar(chave)
+
+    def tamanho_total(self) -> int:
+        """Tamanho total das entradas, em bytes"""
+        return sum(tamanho for _, tamanho, _ in self._entradas())
+
+    # --- Métodos privados ---
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.diretorio, chave)
+
+    def _entradas(self):
+        """Lista (chave, tamanho em bytes, último acesso) de cada entrada"""
+        entradas = []
+        for nome in os.listdir(self.diretorio):
+            caminho = self._caminho(nome)
+            if nome.startswith(".") or not os.path.isdir(caminho):
+                continue
+            tamanho = sum(os.path.getsize(os.path.join(caminho, arquivo)) for arquivo in os.listdir(caminho))
+            entradas.append((nome, tamanho, os.path.getmtime(caminho)))
+        return entradas
+
+    def _despejar(self, manter: Optional[str] = None) -> None:
+        """Remove as entradas menos usadas até o total caber no limite (a entrada 'manter' fica)"""
+        entradas = sorted(self._entradas(), key=lambda entrada: entrada[2])
+        total = sum(tamanho for _, tamanho, _ in entradas)
+
+        for chave, tamanho, _ in entradas:
+            if total <= self.tamanho_max_bytes:
+                break
+            if chave == manter:
+                continue
+            self.invalidar(chave)
+            total -= tamanho
+
+
+if __name__ == "__main__":
+    # Verificações do despejo LRU, da entrada mantida e da remoção, em um diretório temporário
+    with tempfile.TemporaryDirectory() as diretorio:
+        T = np.linspace(0.0, 1.0, 1000)
+        X = np.vstack([T, T**2])
+        chaves = [CacheResultados.chave(problema={'id': i}) for i in range(3)]
+
+        # Limite menor que uma entrada: a recém-salva ('manter') não pode ser despejada
+        cache = CacheResultados(diretorio, tamanho_max_bytes=1)
+        cache.salvar(chaves[0], T, X)
+        assert cache.obter(chaves[0]) is not None, "a entrada recém-salva deve ser mantida"
+        tamanho_entrada = cache.tamanho_total()
+
+        # Cabem duas entradas e meia
+        cache.tamanho_max_bytes = 2 * tamanho_entrada + tamanho_entrada // 2
+        cache.salvar(chaves[1], T, X)
+
+        # Datas explícitas (a resolução do mtime pode ser grosseira); ler a chave 0 a torna a mais recente
+        os.utime(cache._caminho(chaves[0]), (1000, 1000))
+        os.utime(cache._caminho(chaves[1]), (2000, 2000))
+        T0, X0 = cache.obter(chaves[0])
+        assert np.array_equal(X0, X), "os arrays lidos devem ser os salvos"
+        assert os.path.getmtime(cache._caminho(chaves[0])) > 2000, "obter deve marcar o acesso"
+
+        # A terceira entrada passa do limite: sai a menos usada (chave 1)
+        cache.salvar(chaves[2], T, X)
+        restantes = {chave for chave, _, _ in cache._entradas()}
+        assert restantes == {chaves[0], chaves[2]}, "o despejo deve remover a entrada menos usada"
+
+        assert cache.invalidar(chaves[0]) and not cache.invalidar(chaves[0]), "invalidar remove uma vez só"
+        assert cache.obter(chaves[0]) is None
+
+        cache.limpar()
+        assert cache.tamanho_total() == 0 and cache.obter(chaves[2]) is None, "limpar remove tudo"
+
+    print("CacheResultados: verificações OK")
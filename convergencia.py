@@ -0,0 +1,178 @@
+"""
+Estudo de convergência do método do Tiro (RK4) e da diferenciação numérica
+
+Resolve o problema do cabo com passos h, h/2, h/4, ... em paralelo, estima a ordem de precisão
+observada de cada grandeza, aplica extrapolação de Richardson e indica o maior h (o mais barato)
+cujo erro estimado fica abaixo de uma tolerância.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cabo import ProblemaCabo
+from interpolacao import InterpoladorHermite
+from numerical_dif import NumericalDifferentiator
+from solvers_edo import SolverEDO
+
+# Grandezas acompanhadas em cada nível de refinamento
+GRANDEZAS = (
+    'inclinacao_a',         # y'(a) do Tiro
+    'inclinacao_b',         # y'(b) do Tiro
+    'flecha',               # Maior distância vertical entre a corda e o cabo
+    'inclinacao_a_dif',     # y'(a) pela diferenciação numérica da solução do Tiro
+)
+
+# Diferenças entre níveis abaixo disso (relativas à grandeza) são tratadas como arredondamento
+RUIDO_RELATIVO = 1e-12
+
+
+def estudo_convergencia(problema: Optional[ProblemaCabo] = None, h0: float = 0.1, n_niveis: int = 5,
+                        tol: float = 1e-6, tol_tiro: float = 1e-12, grandezas: Sequence[str] = GRANDEZAS,
+                        n_processos: Optional[int] = None) -> Dict:
+    """
+    Resolve o problema com h0, h0/2, ..., h0/2^(n_niveis-1) e estima o erro de cada nível.
+
+    A ordem observada usa três níveis consecutivos: p = log2(|q(h) - q(h/2)| / |q(h/2) - q(h/4)|).
+    O valor extrapolado usa o trio mais fino acima do ruído de arredondamento (RUIDO_RELATIVO):
+    q* = q(h/2) + (q(h/2) - q(h)) / (2^p - 1). O erro estimado de cada nível é |q(h) - q*|.
+
+    Argumentos:
+    problema (ProblemaCabo): Problema a resolver (padrão: o do enunciado); h, tol e max_iter são ignorados
+    h0 (float): Passo do nível mais grosso
+    n_niveis (int): Número de níveis (pelo menos 3)
+    tol (float): Tolerância para o erro estimado das grandezas consideradas na recomendação
+    tol_tiro (float): Tolerância do Tiro em cada nível (pequena para não mascarar o erro de discretização)
+    grandezas (sequência de str): Grandezas consideradas na recomendação de h
+    n_processos (int): Processos do pool (None usa todos os núcleos, 1 resolve em série)
+
+    Retorna:
+    dict: 'h' e 'tempo_s' por nível; 'grandezas' com 'valores', 'ordem' (por trio de níveis),
+          'extrapolado' e 'erro_estimado' de cada grandeza; 'h_recomendado' (None se nenhum nível atende tol)
+    """
+    if n_niveis < 3:
+        raise ValueError("n_niveis deve ser pelo menos 3 para estimar a ordem observada")
+    desconhecidas = set(grandezas) - set(GRANDEZAS)
+    if desconhecidas:
+        raise ValueError(f"Grandezas desconhecidas: {sorted(desconhecidas)}")
+
+    base = problema if problema is not None else ProblemaCabo()
+    base = replace(base, tol=tol_tiro, max_iter=max(base.max_iter, 50))
+    passos = [h0 / 2**k for k in range(n_niveis)]
+    tarefas = [(base, h) for h in passos]
+
+    # Os níveis mais finos dominam o tempo: cada nível é uma tarefa, e o estudo leva ~ o tempo do mais fino
+    if n_processos == 1:
+        niveis = [_resolver_nivel(tarefa) for tarefa in tarefas]
+    else:
+        n_processos = n_processos or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(n_processos, n_niveis)) as executor:
+            niveis = list(executor.map(_resolver_nivel, tarefas))
+
+    resultado = {
+        'h': np.array(passos),
+        'tempo_s': np.array([tempo for _, tempo in niveis]),
+        'grandezas': {},
+    }
+    for nome in GRANDEZAS:
+        valores = np.array([valores[nome] for valores, _ in niveis])
+        resultado['grandezas'][nome] = _richardson(valores)
+
+    # Maior h em que todas as grandezas consideradas atendem a tolerância
+    erro = np.max([resultado['grandezas'][nome]['erro_estimado'] for nome in grandezas], axis=0)
+    atende = np.flatnonzero(erro <= tol)
+    resultado['h_recomendado'] = float(passos[atende[0]]) if len(atende) else None
+
+    return resultado
+
+
+def _richardson(valores: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Ordem observada, valor extrapolado e erro estimado de uma grandeza medida em h, h/2, h/4, ...
+
+    A extrapolação usa o trio mais fino cujas diferenças ainda estão acima do ruído de
+    arredondamento; se nenhum trio estiver, o nível mais fino é a melhor estimativa.
+    """
+    diferencas = np.abs(np.diff(valores))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ordem = np.log2(diferencas[:-1] / diferencas[1:])
+
+    ruido = RUIDO_RELATIVO * np.max(np.abs(valores))
+    confiaveis = np.flatnonzero((diferencas[:-1] > ruido) & (diferencas[1:] > ruido) & (ordem > 0))
+    if len(confiaveis):
+        j = confiaveis[-1]
+        extrapolado = valores[j + 2] + (valores[j + 2] - valores[j + 1]) / (2**ordem[j] - 1)
+    else:
+        extrapolado = valores[-1]
+
+    return {
+        'valores': valores,
+        'ordem': ordem,
+        'extrapolado': float(extrapolado),
+        'erro_estimado': np.abs(valores - extrapolado),
+    }
+
+
+def _resolver_nivel(tarefa: Tuple[ProblemaCabo, float]) -> Tuple[Dict[str, float], float]:
+    """Resolve um nível de refinamento (executado nos processos do pool) e mede suas grandezas"""
+    p, h = tarefa
+    inicio = time.perf_counter()
+
+    T, X = SolverEDO.tiro(p.f, p.a, p.b, h, p.y0, p.yb, p.chute1, p.chute2, tol=p.tol, max_iter=p.max_iter,
+                          metodo=p.metodo, jac=p.jac)
+    y_prime_num, _ = NumericalDifferentiator(X[0], T[1] - T[0]).calculate_derivatives()
+
+    valores = {
+        'inclinacao_a': float(X[1, 0]),
+        'inclinacao_b': float(X[1, -1]),
+        'flecha': _flecha(p, T, X),
+        'inclinacao_a_dif': float(y_prime_num[0]),
+    }
+    return valores, time.perf_counter() - inicio
+
+
+def _flecha(p: ProblemaCabo, T: np.ndarray, X: np.ndarray) -> float:
+    """
+    Maior distância vertical entre a corda e o cabo.
+
+    O máximo na malha é refinado com um passo de Newton para corda' = y' e avaliado pelo
+    interpolante de Hermite, para que a flecha não carregue o erro O(h²) da amostragem.
+    """
+    inclinacao_corda = (p.yb - p.y0) / (p.b - p.a)
+    distancia = p.y0 + inclinacao_corda * (T - p.a) - X[0]
+    i = int(np.argmax(distancia))
+
+    interpolante = InterpoladorHermite.da_solucao(p.f, T, X)
+    _, d2y = p.f(T[i], X[:, i])
+    x_max = float(np.clip(T[i] + (inclinacao_corda - X[1, i]) / d2y, T[0], T[-1]))
+    return float(p.y0 + inclinacao_corda * (x_max - p.a) - interpolante(x_max)[0])
+
+
+if __name__ == "__main__":
+    from solucao_analitica import SolucaoAnaliticaCabo
+
+    p = ProblemaCabo()
+    tol = 1e-8
+    inicio = time.perf_counter()
+    estudo = estudo_convergencia(p, tol=tol, grandezas=('inclinacao_a', 'inclinacao_b', 'flecha'))
+    print(f"Estudo com {len(estudo['h'])} niveis em {time.perf_counter() - inicio:.2f} s")
+
+    exata = SolucaoAnaliticaCabo.do_problema(p)
+    referencias = {'inclinacao_a': float(exata.dy(p.a)), 'inclinacao_b': float(exata.dy(p.b)),
+                   'inclinacao_a_dif': float(exata.dy(p.a))}
+
+    for nome, g in estudo['grandezas'].items():
+        print(f"\n{nome}: extrapolado = {g['extrapolado']:.12f}", end="")
+        if nome in referencias:
+            print(f" (erro real {abs(g['extrapolado'] - referencias[nome]):.1e})", end="")
+        print("\n         h     valor              erro estimado   ordem")
+        ordens = [math.nan, math.nan] + list(g['ordem'])
+        for h, valor, erro, ordem in zip(estudo['h'], g['valores'], g['erro_estimado'], ordens):
+            print(f"  {h:9.6f}   {valor:.12f}   {erro:.2e}        {ordem:5.2f}")
+
+    print(f"\nMaior h com erro estimado <= {tol:.0e} (Tiro): {estudo['h_recomendado']}")
@@ -0,0 +1,158 @@
+"""
+Execução em lote, sem interação, de problemas do cabo descritos em JSON Lines
+
+Cada linha de entrada é um objeto JSON com campos de ProblemaCabo (os ausentes usam os valores
+do enunciado) e, opcionalmente, um "id". Cada problema passa pelo método do Tiro, pela
+diferenciação numérica e pela regressão polinomial, e uma linha JSON de resultado é escrita
+assim que ele termina (a ordem de saída é a de término, não a de entrada).
+
+Uso:
+    python execucao_lote.py problemas.jsonl --processos 4 > resultados.jsonl
+    cat problemas.jsonl | python execucao_lote.py - --saida resultados.jsonl
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from cabo import ProblemaCabo
+from pipeline import PipelineCabo
+
+
+def ler_trabalhos(linhas: Iterable[str]) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    Lê os trabalhos de linhas JSON Lines (linhas vazias são ignoradas).
+
+    Retorna pares (id, definição); o id padrão é o número da linha. Linhas que não são objetos
+    JSON válidos geram a definição {'_erro': mensagem}, reportada como erro do trabalho.
+    """
+    for numero, linha in enumerate(linhas, start=1):
+        if not linha.strip():
+            continue
+        try:
+            definicao = json.loads(linha)
+        except json.JSONDecodeError as erro:
+            yield numero, {'_erro': f"JSON inválido na linha {numero}: {erro.msg}"}
+            continue
+        if not isinstance(definicao, dict):
+            yield numero, {'_erro': f"A linha {numero} não é um objeto JSON"}
+            continue
+        yield definicao.pop('id', numero), definicao
+
+
+def resolver_trabalho(trabalho: Tuple[Any, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Resolve um problema (executado nos processos do pool) e retorna a linha de resultado.
+
+    Erros do trabalho (campos inválidos, falhas numéricas) viram {'id', 'erro'} em vez de exceções,
+    para que um problema ruim não interrompa o lote.
+    """
+    ident, definicao = trabalho
+    inicio = time.perf_counter()
+
+    try:
+        if '_erro' in definicao:
+            raise ValueError(definicao['_erro'])
+        problema = ProblemaCabo(**definicao)
+        pipeline = PipelineCabo(problema)
+
+        # As etapas imprimem relatórios no terminal; a saída padrão é reservada às linhas de resultado
+        with contextlib.redirect_stdout(io.StringIO()):
+            resultados = pipeline.executar()
+    except Exception as erro:
+        return {'id': ident, 'erro': f"{type(erro).__name__}: {erro}"}
+
+    T, X = resultados['obs1']
+    _, _, y_prime_num, _, erros_edo = resultados['obs2']
+    regressao = resultados['obs3']
+
+    return {
+        'id': ident,
+        'problema': asdict(problema),
+        'n_pontos': len(T),
+        'inclinacao_a': float(X[1, 0]),
+        'inclinacao_b': float(X[1, -1]),
+        'erro_contorno': float(abs(X[0, -1] - problema.yb)),
+        'y_min': float(X[0].min()),
+        'erro_derivada_max': float(np.max(np.abs(X[1] - y_prime_num))),
+        'erro_edo_rms': float(np.sqrt(np.mean(erros_edo**2))),
+        'coeficientes': [float(c) for c in regressao['coeficientes']],
+        'r_squared': float(regressao['r_squared']),
+        'erro_medio_regressao': float(regressao['erro_medio']),
+        'tempo_s': time.perf_counter() - inicio,
+    }
+
+
+def executar_lote(trabalhos: Iterable[Tuple[Any, Dict[str, Any]]], n_processos: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Resolve os trabalhos e produz cada resultado assim que fica pronto.
+
+    No máximo 2 trabalhos por processo ficam pendentes, de modo que arquivos grandes (ou uma
+    entrada padrão sem fim) são consumidos aos poucos.
+
+    Argumentos:
+    trabalhos (iterável): Pares (id, definição), como os de ler_trabalhos
+    n_processos (int): Processos do pool (None usa todos os núcleos, 1 resolve em série no processo atual)
+    """
+    if n_processos == 1:
+        for trabalho in trabalhos:
+            yield resolver_trabalho(trabalho)
+        return
+
+    # Importado aqui: concurrent.futures.process pesa na inicialização, paga a cada chamada do CLI
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    n_processos = n_processos or os.cpu_count() or 1
+    trabalhos = iter(trabalhos)
+    with ProcessPoolExecutor(max_workers=n_processos) as executor:
+        pendentes: set = set()
+        esgotado = False
+        while pendentes or not esgotado:
+            while not esgotado and len(pendentes) < 2 * n_processos:
+                trabalho = next(trabalhos, None)
+                if trabalho is None:
+                    esgotado = True
+                else:
+                    pendentes.add(executor.submit(resolver_trabalho, trabalho))
+            if pendentes:
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    yield futuro.result()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Resolve em lote problemas do cabo descritos em JSON Lines")
+    parser.add_argument('entrada', nargs='?', default='-', help="Arquivo JSON Lines com os problemas ('-' lê da entrada padrão)")
+    parser.add_argument('--saida', help="Arquivo JSON Lines de resultados (padrão: saída padrão)")
+    parser.add_argument('--processos', type=int, default=None, help="Número de processos (padrão: todos os núcleos)")
+    args = parser.parse_args(argv)
+
+    entrada: TextIO = sys.stdin if args.entrada == '-' else open(args.entrada, encoding='utf-8')
+    saida: TextIO = sys.stdout if args.saida is None else open(args.saida, 'w', encoding='utf-8')
+
+    falhas = 0
+    try:
+        for resultado in executar_lote(ler_trabalhos(entrada), args.processos):
+            falhas += 'erro' in resultado
+            saida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            saida.flush()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
+    # Código de saída 1 quando algum trabalho falhou, para o escalonador poder detectar
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
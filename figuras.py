@@ -0,0 +1,209 @@
+"""
+Figuras do projeto: desenho, exibição interativa e renderização em PNG para o relatório PDF
+
+Cada figura é uma função que desenha em uma matplotlib.figure.Figure a partir de arrays. A
+mesma função serve para a janela interativa (plt.show) e para a renderização sem interface
+(Agg), feita em paralelo em um pool de processos. Os PNGs ficam em cache, com nome dado pelo
+hash dos dados de entrada, e só são renderizados de novo quando os dados mudam.
+
+O matplotlib só é importado quando uma figura é de fato desenhada, para que importar este
+módulo (e regressao, pipeline, main) não pague o custo de inicialização dele.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+# Incrementar quando o desenho de alguma figura mudar, invalidando os PNGs em cache
+VERSAO_FIGURAS = 1
+
+# Resolução dos PNGs do relatório
+DPI = 100
+
+
+def desenhar_obs1_obs2(fig, T, y, dy, d1, d2, lado_direito):
+    """Obs.1 e Obs.2: solução, 1ª derivada (RK4 e numérica) e verificação da EDO"""
+    ax1, ax2 = fig.subplots(1, 2)
+
+    # Gráfico 1: Solução y(x) e sua derivada primeira y'(x)
+    ax1.plot(T, y, 'b-', linewidth=2, label='y(x) - Solução')
+    ax1.plot(T, dy, 'r--', linewidth=2, label="y'(x) - 1ª Derivada")
+    ax1.plot(T, d1, 'g:', linewidth=1, alpha=0.7, label="y'(x) - Numérica")
+    ax1.set_xlabel('x')
+    ax1.set_ylabel('y(x), y\'(x)')
+    ax1.set_title('Obs.1 e Obs.2: Solução e 1ª Derivada')
+    ax1.legend()
+    ax1.grid(True, linestyle='--', alpha=0.6)
+
+    # Gráfico 2: Segunda derivada e verificação da EDO
+    ax2.plot(T, d2, 'b-', linewidth=2, label="y''(x) - 2ª Derivada Numérica")
+    ax2.plot(T, lado_direito, 'r--', linewidth=2, label=f"C√(1+y'²) - Lado Direito EDO")
+    ax2.set_xlabel('x')
+    ax2.set_ylabel("y''(x)")
+    ax2.set_title('Obs.2: Verificação da EDO')
+    ax2.legend()
+    ax2.grid(True, linestyle='--', alpha=0.6)
+
+    # Ajusta o layout para evitar sobreposição
+    fig.tight_layout(rect=[0, 0, 1, 0.95])
+
+
+def desenhar_regressao(fig, x, y, y_poly, dy_poly, d2y_poly, lado_direito, r_squared, erro_medio):
+    """Obs.3: solução vs. polinômio, derivadas do polinômio e verificação da EDO"""
+    axs = fig.subplots(3, 1)
+    fig.suptitle('Obs.3: Regressão Polinomial de Grau 4 e Verificação da EDO', fontsize=16, fontweight='bold')
+
+    # --- Gráfico 1: Comparação solução original vs polinômio ---
+    ax1 = axs[0]
+    ax1.plot(x, y, 'b-', linewidth=2, label='Solução Original (RK4+Tiro)')
+    ax1.plot(x, y_poly, 'r--', linewidth=2, label='Polinômio de Grau 4')
+    ax1.set_ylabel('y(x)')
+    ax1.set_title(f'Comparação: Solução Original vs Regressão Polinomial (R² = {r_squared:.4f})')
+    ax1.legend()
+    ax1.grid(True, alpha=0.6)
+
+    # --- Gráfico 2: Derivadas do polinômio ---
+    ax2 = axs[1]
+    ax2.plot(x, y_poly, 'k-', linewidth=2, label='P(x) - Polinômio')
+    ax2.plot(x, dy_poly, 'g--', linewidth=2, label="P'(x) - 1ª Derivada")
+    ax2.plot(x, d2y_poly, 'r:', linewidth=2, label="P''(x) - 2ª Derivada")
+    ax2.set_ylabel('Valor')
+    ax2.set_title('Polinômio e suas Derivadas Analíticas')
+    ax2.legend()
+    ax2.grid(True, alpha=0.6)
+
+    # --- Gráfico 3: Verificação da EDO ---
+    ax3 = axs[2]
+    ax3.plot(x, d2y_poly, 'b-', linewidth=3, label="Lado Esquerdo: P''(x)")
+    ax3.plot(x, lado_direito, 'r--', linewidth=2, label="Lado Direito: C√(1 + P'(x)²)")
+    ax3.set_xlabel('x (Posição Horizontal)')
+    ax3.set_ylabel('Valor da Curvatura')
+    ax3.set_title(f'Verificação da EDO (Erro Médio: {erro_medio:.2e})')
+    ax3.legend()
+    ax3.grid(True, alpha=0.6)
+
+    fig.tight_layout(rect=[0, 0, 1, 0.96])
+
+
+def desenhar_erro_regressao(fig, x, erro_edo, erro_medio, erro_maximo):
+    """Obs.3: erro absoluto do polinômio na EDO, em escala logarítmica"""
+    ax = fig.subplots()
+    ax.plot(x, erro_edo, 'r-', linewidth=2)
+    ax.set_xlabel('x (Posição Horizontal)')
+    ax.set_ylabel('Erro Absoluto |P\'\'(x) - C√(1 + P\'(x)²)|')
+    ax.set_title(f'Erro na Satisfação da EDO pelo Polinômio de Grau 4\n(Erro Médio: {erro_medio:.2e}, Erro Máximo: {erro_maximo:.2e})')
+    ax.grid(True, alpha=0.6)
+    ax.set_yscale('log')  # Escala logarítmica para melhor visualização
+    fig.tight_layout()
+
+
+# Nome -> (função de desenho, tamanho em polegadas)
+FIGURAS: Dict[str, Tuple[Callable, Tuple[float, float]]] = {
+    'obs1_obs2': (desenhar_obs1_obs2, (15, 6)),
+    'regressao': (desenhar_regressao, (15, 16)),
+    'erro_regressao': (desenhar_erro_regressao, (12, 6)),
+}
+
+
+def dados_obs1_obs2(resultados_obs2, C: float) -> dict:
+    """Dados da figura 'obs1_obs2' a partir do resultado da Obs.2 do PipelineCabo"""
+    T, X, d1, d2, _ = resultados_obs2
+    return {'T': T, 'y': X[0], 'dy': X[1], 'd1': d1, 'd2': d2, 'lado_direito': C * np.sqrt(1.0 + d1**2)}
+
+
+def dados_regressao(resultados_obs3, C: float) -> dict:
+    """Dados da figura 'regressao' a partir do resultado de regressao_polinomial"""
+    x = resultados_obs3['x_data']
+    polinomio = resultados_obs3['polinomio']
+    dy_poly = polinomio.deriv(1)(x)
+    return {'x': x, 'y': resultados_obs3['y_data'], 'y_poly': polinomio(x), 'dy_poly': dy_poly,
+            'd2y_poly': polinomio.deriv(2)(x), 'lado_direito': C * np.sqrt(1.0 + dy_poly**2),
+            'r_squared': resultados_obs3['r_squared'], 'erro_medio': resultados_obs3['erro_medio']}
+
+
+def dados_erro_regressao(resultados_obs3, C: float) -> dict:
+    """Dados da figura 'erro_regressao' a partir do resultado de regressao_polinomial"""
+    d = dados_regressao(resultados_obs3, C)
+    return {'x': d['x'], 'erro_edo': np.abs(d['d2y_poly'] - d['lado_direito']),
+            'erro_medio': resultados_obs3['erro_medio'], 'erro_maximo': resultados_obs3['erro_maximo']}
+
+
+def mostrar(nome: str, **dados):
+    """Desenha a figura em uma janela do pyplot e a exibe"""
+    import matplotlib.pyplot as plt
+
+    desenhar, tamanho = FIGURAS[nome]
+    fig = plt.figure(figsize=tamanho)
+    desenhar(fig, **dados)
+    plt.show()
+
+
+def chave_figura(nome: str, dados: dict) -> str:
+    """Hash SHA-256 do nome da figura e dos dados de entrada (arrays pelo conteúdo binário)"""
+    sha = hashlib.sha256(f"{VERSAO_FIGURAS}:{DPI}:{nome}".encode('utf-8'))
+    for campo in sorted(dados):
+        valor = np.asarray(dados[campo])
+        sha.update(f"|{campo}:{valor.dtype}:{valor.shape}|".encode('utf-8'))
+        sha.update(np.ascontiguousarray(valor).tobytes())
+    return sha.hexdigest()
+
+
+def renderizar_figuras(pedidos: Dict[str, Tuple[str, dict]], diretorio: str = ".cache_figuras",
+                       n_processos: Optional[int] = None) -> Dict[str, str]:
+    """
+    Renderiza figuras em PNG (backend Agg), em paralelo e com cache por hash dos dados.
+
+    Argumentos:
+    pedidos (dict): Identificador -> (nome da figura em FIGURAS, dados da figura)
+    diretorio (str): Diretório dos PNGs em cache (criado se não existir)
+    n_processos (int): Processos do pool (None usa todos os núcleos, até um por figura; 1 renderiza em série)
+
+    Retorna:
+    dict: Identificador -> caminho do PNG
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    caminhos = {ident: os.path.join(diretorio, f"{chave_figura(nome, dados)}.png")
+                for ident, (nome, dados) in pedidos.items()}
+
+    tarefas = [(nome, dados, caminhos[ident]) for ident, (nome, dados) in pedidos.items()
+               if not os.path.exists(caminhos[ident])]
+
+    # Cada figura é uma tarefa: com um processo por figura, o tempo total é ~ o da figura mais lenta
+    n_processos = min(n_processos or os.cpu_count() or 1, len(tarefas))
+    if n_processos <= 1:
+        for tarefa in tarefas:
+            _renderizar(tarefa)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_processos) as executor:
+            list(executor.map(_renderizar, tarefas))
+
+    return caminhos
+
+
+def _renderizar(tarefa: Tuple[str, dict, str]) -> None:
+    """Desenha uma figura e salva em PNG (executado nos processos do pool)"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    nome, dados, caminho = tarefa
+    desenhar, tamanho = FIGURAS[nome]
+
+    # Figure + FigureCanvasAgg não passam pelo pyplot: nenhum backend interativo é envolvido
+    fig = Figure(figsize=tamanho)
+    FigureCanvasAgg(fig)
+    desenhar(fig, **dados)
+
+    # Escreve em arquivo temporário e renomeia, para que um PNG parcial nunca apareça no cache
+    descritor, temporario = tempfile.mkstemp(suffix=".png", dir=os.path.dirname(caminho))
+    try:
+        with os.fdopen(descritor, 'wb') as arquivo:
+            fig.savefig(arquivo, format='png', dpi=DPI)
+        os.chmod(temporario, 0o644)
+        os.replace(temporario, caminho)
+    except BaseException:
+        os.remove(temporario)
+        raise
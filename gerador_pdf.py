@@ -3,7 +3,6 @@ Gerador de Relatório PDF para o Projeto de Métodos Numéricos
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
@@ -11,16 +10,28 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+import argparse
 import io
 import os
+from contextlib import nullcontext
 
-from solvers_edo import SolverEDO
-from numerical_dif import NumericalDifferentiator
-from regressao import regressao_polinomial
+from pipeline import PipelineCabo
+from cache_resultados import CacheResultados
+from artefato_resultados import ResultadosArtefato
+from figuras import dados_erro_regressao, dados_obs1_obs2, dados_regressao, renderizar_figuras
 
 class RelatorPDF:
-    def __init__(self, nome_arquivo="resultado_metodos_numericos.pdf"):
+    # Largura das figuras na página (a altura segue a proporção do PNG)
+    LARGURA_FIGURA = 6.5 * inch
+
+    def __init__(self, nome_arquivo="resultado_metodos_numericos.pdf", pipeline=None, diretorio_figuras=".cache_figuras"):
         self.nome_arquivo = nome_arquivo
+        # Resultados já calculados no pipeline (ex.: pelo main) são reaproveitados sem recalcular;
+        # um ResultadosArtefato também serve, e então nenhuma etapa numérica é executada
+        self.pipeline = pipeline if pipeline is not None else PipelineCabo()
+        # PNGs das figuras, renderizados em paralelo e guardados em cache por hash dos dados
+        self.diretorio_figuras = diretorio_figuras
+        self.figuras = {}
         self.doc = SimpleDocTemplate(nome_arquivo, pagesize=A4)
         self.styles = getSampleStyleSheet()
         self.story = []
@@ -58,6 +69,7 @@ class RelatorPDF:
         self.story.append(Spacer(1, 12))
         alunos_texto = "Pedro Druck Montalvão Reis - 241040332, Lucas Andrade Zanetti - 241039645, Tiago Santos Bittencourt - 241011653, Angel Daniel Grau Barreto - 241025158"
         alunos_paragraph = Paragraph(alunos_texto, self.styles['Normal'])
+        p = self.pipeline.problema
         # Informações do projeto
         info_data = [
             ["Disciplina:", "Métodos Numéricos"],
@@ -65,8 +77,8 @@ class RelatorPDF:
             ["Alunos:", alunos_paragraph],
             ["Data:", datetime.now().strftime("%d/%m/%Y %H:%M")],
             ["Equação:", "d^2y/dx^2 = C*sqrt(1 + (dy/dx)^2)"],
-            ["Constante C:", "0.041"],
-            ["Condições:", "y(0) = 15, y(20) = 10"]
+            ["Constante C:", f"{p.C:g}"],
+            ["Condições:", f"y({p.a:g}) = {p.y0:g}, y({p.b:g}) = {p.yb:g}"]
         ]
         
         info_table = Table(info_data, colWidths=[2*inch, 3*inch])
@@ -88,27 +100,28 @@ class RelatorPDF:
         self.story.append(Paragraph("1. OBSERVAÇÃO 1: MÉTODO DO TIRO COM RUNGE-KUTTA 4ª ORDEM", self.subtitulo_style))
         
         # Descrição do método
-        descricao = """
+        p = self.pipeline.problema
+        descricao = f"""
         O método do tiro transforma o problema de valor de contorno (PVC) em um problema de valor inicial (PVI).
         Utilizamos o método de Runge-Kutta de 4ª ordem para resolver o sistema de EDOs de primeira ordem equivalente.
-        O processo iterativo ajusta o chute inicial para y'(0) até satisfazer a condição de contorno y(20) = 10.
+        O processo iterativo ajusta o chute inicial para y'({p.a:g}) até satisfazer a condição de contorno y({p.b:g}) = {p.yb:g}.
         """
         self.story.append(Paragraph(descricao, self.styles['Normal']))
         self.story.append(Spacer(1, 12))
         
         # Resultados numéricos
         T, X = resultados_obs1
-        erro_contorno = abs(X[0, -1] - 10)
+        erro_contorno = abs(X[0, -1] - p.yb)
         
         resultados_data = [
             ["Parâmetro", "Valor"],
             ["Número de pontos calculados", f"{len(T)}"],
-            ["Passo de integração (h)", "0.01"],
-            ["Valor inicial y(0)", f"{X[0, 0]:.6f}"],
-            ["Valor final y(20)", f"{X[0, -1]:.6f}"],
+            ["Passo de integração (h)", f"{T[1] - T[0]:g}"],
+            [f"Valor inicial y({p.a:g})", f"{X[0, 0]:.6f}"],
+            [f"Valor final y({p.b:g})", f"{X[0, -1]:.6f}"],
             ["Erro na condição de contorno", f"{erro_contorno:.2e}"],
-            ["Derivada inicial estimada y'(0)", f"{X[1, 0]:.6f}"],
-            ["Derivada final y'(20)", f"{X[1, -1]:.6f}"],
+            [f"Derivada inicial estimada y'({p.a:g})", f"{X[1, 0]:.6f}"],
+            [f"Derivada final y'({p.b:g})", f"{X[1, -1]:.6f}"],
             ["Valor mínimo de y(x)", f"{X[0].min():.4f}"],
             ["Valor máximo de y(x)", f"{X[0].max():.4f}"]
         ]
@@ -196,7 +209,7 @@ class RelatorPDF:
         self.story.append(Spacer(1, 12))
         
         # Verificação da EDO em pontos específicos
-        C = 0.041
+        C = self.pipeline.problema.C
         verificacao_data = [["x", "y(x)", "y'(x)", "y''(x)", "C*sqrt(1+y'^2)", "Erro EDO"]]
         indices = [0, len(T)//4, len(T)//2, 3*len(T)//4, -1]
         
@@ -223,6 +236,7 @@ class RelatorPDF:
         
         self.story.append(Paragraph("Verificação da EDO em pontos específicos:", self.styles['Heading3']))
         self.story.append(verif_table)
+        self.adicionar_figura('obs1_obs2', "Figura 1: Solução, 1ª derivada e verificação da EDO (Obs.1 e Obs.2)")
         self.story.append(PageBreak())
 
     def adicionar_secao_obs3(self, resultados_obs3):
@@ -288,6 +302,9 @@ class RelatorPDF:
         self.story.append(Paragraph("Análise da qualidade do ajuste:", self.styles['Heading3']))
         self.story.append(qual_table)
         self.story.append(Spacer(1, 12))
+
+        self.adicionar_figura('regressao', "Figura 2: Regressão polinomial de grau 4 e verificação da EDO (Obs.3)")
+        self.adicionar_figura('erro_regressao', "Figura 3: Erro do polinômio na EDO (escala logarítmica)")
         
         # Conclusões
         conclusoes = f"""
@@ -299,6 +316,32 @@ class RelatorPDF:
         """
         self.story.append(Paragraph(conclusoes, self.styles['Normal']))
 
+    def adicionar_figura(self, nome, legenda):
+        """Adiciona uma figura já renderizada (ver renderizar_figuras) com sua legenda"""
+        caminho = self.figuras.get(nome)
+        if caminho is None:
+            return
+
+        imagem = Image(caminho)
+        imagem.drawHeight = self.LARGURA_FIGURA * imagem.imageHeight / imagem.imageWidth
+        imagem.drawWidth = self.LARGURA_FIGURA
+        self.story.append(Spacer(1, 12))
+        self.story.append(imagem)
+        self.story.append(Paragraph(legenda, self.styles['Italic']))
+        self.story.append(Spacer(1, 12))
+
+    def renderizar_figuras(self, resultados_obs2, resultados_obs3):
+        """Renderiza (ou recupera do cache) os PNGs de todas as figuras do relatório, em paralelo"""
+        C = self.pipeline.problema.C
+        pedidos = {
+            'obs1_obs2': ('obs1_obs2', dados_obs1_obs2(resultados_obs2, C)),
+            'regressao': ('regressao', dados_regressao(resultados_obs3, C)),
+            'erro_regressao': ('erro_regressao', dados_erro_regressao(resultados_obs3, C)),
+        }
+        instrumentacao = self.pipeline.instrumentacao
+        with instrumentacao.etapa('figuras') if instrumentacao is not None else nullcontext():
+            self.figuras = renderizar_figuras(pedidos, self.diretorio_figuras)
+
     def adicionar_conclusoes_gerais(self):
         """Adiciona conclusões gerais do estudo"""
         self.story.append(PageBreak())
@@ -339,7 +382,8 @@ class RelatorPDF:
         self.story.append(PageBreak())
         self.story.append(Paragraph("5. METODOLOGIA E IMPLEMENTAÇÃO", self.subtitulo_style))
         
-        metodologia = """
+        p = self.pipeline.problema
+        metodologia = f"""
         <b>Linguagem e Bibliotecas:</b>
         • Python 3.13.3 com NumPy 2.3.1 para computação numérica
         • Matplotlib 3.10.3 para visualização de resultados
@@ -351,10 +395,10 @@ class RelatorPDF:
         • Função regressao_polinomial: ajuste polinomial e verificação
         
         <b>Parâmetros de Simulação:</b>
-        • Passo de integração: h = 0.01
-        • Intervalo de análise: [0, 20]
-        • Tolerância no método do tiro: 10^(-5)
-        • Máximo de iterações: 100
+        • Passo de integração: h = {p.h:g}
+        • Intervalo de análise: [{p.a:g}, {p.b:g}]
+        • Tolerância no método do tiro: {p.tol:g}
+        • Máximo de iterações: {p.max_iter}
         
         <b>Critérios de Validação:</b>
         • Verificação das condições de contorno
@@ -369,20 +413,23 @@ class RelatorPDF:
         """Gera o relatório PDF completo"""
         print("Gerando relatório PDF detalhado...")
         
-        # Cabeçalho
-        self.adicionar_cabecalho()
-        
         # Executar análises e coletar resultados
         print("Executando Obs.1 (Método do Tiro)...")
         resultados_obs1 = self._executar_obs1()
-        self.adicionar_secao_obs1(resultados_obs1)
         
         print("Executando Obs.2 (Diferenciação Numérica)...")
         resultados_obs2 = self._executar_obs2(resultados_obs1)
-        self.adicionar_secao_obs2(resultados_obs2)
         
         print("Executando Obs.3 (Regressão Polinomial)...")
         resultados_obs3 = self._executar_obs3()
+
+        print("Renderizando figuras...")
+        self.renderizar_figuras(resultados_obs2, resultados_obs3)
+
+        # Cabeçalho e seções das observações
+        self.adicionar_cabecalho()
+        self.adicionar_secao_obs1(resultados_obs1)
+        self.adicionar_secao_obs2(resultados_obs2)
         self.adicionar_secao_obs3(resultados_obs3)
         
         # Seções finais
@@ -391,70 +438,47 @@ class RelatorPDF:
         
         # Gerar PDF
         print(f"Salvando relatório em {self.nome_arquivo}...")
-        self.doc.build(self.story)
+        instrumentacao = self.pipeline.instrumentacao
+        with instrumentacao.etapa('relatorio_pdf') if instrumentacao is not None else nullcontext():
+            self.doc.build(self.story)
         print(f"Relatório PDF gerado com sucesso: {self.nome_arquivo}")
 
     def _executar_obs1(self):
         """Executa a Observação 1 e retorna resultados"""
-        C = 0.041
-        
-        def f(t, y2):
-            y, w = y2
-            dydx = w
-            dwdx = C * np.sqrt(1.0 + w**2)
-            return np.array([dydx, dwdx])
-        
-        a, b, h = 0.0, 20, 0.01
-        y0, yb = 15, 10
-        chute1, chute2 = -5, 10
-        
-        T, X = SolverEDO.tiro(f, a, b, h, y0, yb, chute1, chute2, max_iter=10)
-        return T, X
+        return self.pipeline.resultado('obs1')
 
     def _executar_obs2(self, resultados_obs1):
         """Executa a Observação 2 e retorna resultados"""
-        T, X = resultados_obs1
-        
-        # Calcular passo de integração
-        h = T[1] - T[0]
-        
-        diff = NumericalDifferentiator(X[0], h)
-        
-        y_prime_num, y_double_prime_num = diff.calculate_derivatives()
-        
-        C = 0.041
-        lado_direito_edo = C * np.sqrt(1.0 + np.array(y_prime_num)**2)
-        erros_edo = np.abs(np.array(y_double_prime_num) - lado_direito_edo)
-        
-        return T, X, np.array(y_prime_num), np.array(y_double_prime_num), erros_edo
+        return self.pipeline.resultado('obs2')
 
     def _executar_obs3(self):
         """Executa a Observação 3 e retorna resultados"""
-        # Salvar backend atual do matplotlib
-        import matplotlib
-        current_backend = matplotlib.get_backend()
-        
-        # Usar backend que não exibe gráficos
-        matplotlib.use('Agg')
-        
-        try:
-            resultado = regressao_polinomial(mostrar_graficos=False)
-        finally:
-            # Restaurar backend original
-            matplotlib.use(current_backend)
-            
-        return resultado
+        return self.pipeline.resultado('obs3')
 
 
-def gerar_pdf_relatorio(nome_arquivo="resultado_metodos_numericos.pdf"):
+def gerar_pdf_relatorio(nome_arquivo="resultado_metodos_numericos.pdf", pipeline=None, artefato=None,
+                        diretorio_figuras=".cache_figuras"):
     """
     Função principal para gerar o relatório PDF
+
+    Se um PipelineCabo for fornecido, os resultados já calculados nele são reaproveitados.
+    Com artefato (caminho sem extensão gravado por artefato_resultados.salvar_artefato), os
+    resultados são lidos do artefato e nenhuma etapa numérica é executada. Os PNGs das figuras
+    ficam em cache em diretorio_figuras.
     """
-    relator = RelatorPDF(nome_arquivo)
+    if artefato is not None:
+        pipeline = ResultadosArtefato(artefato)
+    relator = RelatorPDF(nome_arquivo, pipeline, diretorio_figuras)
     relator.gerar_relatorio_completo()
     return nome_arquivo
 
 
 if __name__ == "__main__":
-    nome_pdf = gerar_pdf_relatorio()
+    parser = argparse.ArgumentParser(description="Gera o relatório PDF das observações")
+    parser.add_argument('--saida', default="resultado_metodos_numericos.pdf", help="Arquivo PDF gerado")
+    parser.add_argument('--artefato', help="Gera a partir de um artefato de resultados (caminho sem extensão)")
+    args = parser.parse_args()
+
+    pipeline = None if args.artefato else PipelineCabo(cache=CacheResultados())
+    nome_pdf = gerar_pdf_relatorio(args.saida, pipeline=pipeline, artefato=args.artefato)
     print(f"\nRelatório PDF gerado: {nome_pdf}")
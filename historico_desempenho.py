@@ -0,0 +1,286 @@
+"""
+Histórico local de desempenho por commit, com comparação e detecção de regressões
+
+Os tempos dos pontos de entrada principais são guardados em um banco SQLite, uma linha por
+amostra, junto com o commit do git em que foram medidos. O comando 'comparar' confronta as
+amostras de dois commits e falha (código de saída 1) se algum ponto de entrada ficou mais lento
+de forma estatisticamente significativa e acima do limite relativo.
+
+Medições feitas com alterações locais não commitadas ficam separadas das do commit limpo e são
+identificadas como '<commit>-dirty'.
+
+Uso:
+    python historico_desempenho.py registrar --repeticoes 5
+    python historico_desempenho.py comparar --base <commit> [--atual <commit>[-dirty]] [--limite 0.05]
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import math
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+ARQUIVO_PADRAO = ".historico_desempenho.sqlite"
+
+# Sufixo do identificador das medições feitas com alterações locais (ex.: 'abc123-dirty')
+SUFIXO_ALTERACOES = "-dirty"
+
+
+def _executar_tiro():
+    from cabo import ProblemaCabo
+    from solvers_edo import SolverEDO
+    p = ProblemaCabo()
+    return SolverEDO.tiro(p.f, p.a, p.b, p.h, p.y0, p.yb, p.chute1, p.chute2, tol=p.tol, max_iter=p.max_iter)
+
+
+def _preparar_diferenciacao(pilha: contextlib.ExitStack) -> Callable:
+    from numerical_dif import NumericalDifferentiator
+    T, X = _executar_tiro()
+    return lambda: NumericalDifferentiator(X[0], T[1] - T[0]).calculate_derivatives()
+
+
+def _preparar_regressao(pilha: contextlib.ExitStack) -> Callable:
+    from regressao import regressao_polinomial
+    solucao = _executar_tiro()
+    return lambda: regressao_polinomial(mostrar_graficos=False, solucao=solucao)
+
+
+def _preparar_relatorio(pilha: contextlib.ExitStack) -> Callable:
+    from gerador_pdf import gerar_pdf_relatorio
+    # Removido (com o PDF) quando as amostras terminam
+    diretorio = pilha.enter_context(tempfile.TemporaryDirectory())
+    arquivo = os.path.join(diretorio, "relatorio.pdf")
+
+    def executar():
+        # Cache de figuras vazio a cada amostra: PNGs de uma amostra anterior (ou do .cache_figuras
+        # de uma execução do main) esconderiam o custo da renderização, que é o que se quer acompanhar
+        with tempfile.TemporaryDirectory(dir=diretorio) as figuras:
+            gerar_pdf_relatorio(arquivo, diretorio_figuras=figuras)
+
+    return executar
+
+
+def _preparar_inicializacao(pilha: contextlib.ExitStack) -> Callable:
+    # Interpretador novo a cada amostra: mede o custo de importação pago por cada execução do main
+    comando = [sys.executable, '-c', 'import main']
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    return lambda: subprocess.run(comando, cwd=diretorio, check=True)
+
+
+# Ponto de entrada -> função que prepara as entradas (fora da medição) e retorna o que será medido;
+# recursos que devem durar até o fim das amostras são registrados na ExitStack recebida
+PONTOS_DE_ENTRADA: Dict[str, Callable[[contextlib.ExitStack], Callable]] = {
+    'SolverEDO.tiro': lambda pilha: _executar_tiro,
+    'NumericalDifferentiator': _preparar_diferenciacao,
+    'regressao_polinomial': _preparar_regressao,
+    'gerar_pdf_relatorio': _preparar_relatorio,
+    'inicializacao_main': _preparar_inicializacao,
+}
+
+
+class HistoricoDesempenho:
+    """Banco SQLite com as amostras de tempo de cada ponto de entrada por commit"""
+
+    def __init__(self, arquivo: str = ARQUIVO_PADRAO):
+        self.conexao = sqlite3.connect(arquivo)
+        self.conexao.execute("""
+            CREATE TABLE IF NOT EXISTS amostras (
+                commit_id TEXT NOT NULL,
+                alteracoes_locais INTEGER NOT NULL,
+                registrado_em REAL NOT NULL,
+                ponto_entrada TEXT NOT NULL,
+                segundos REAL NOT NULL
+            )""")
+        self.conexao.commit()
+
+    def registrar(self, commit_id: str, ponto_entrada: str, amostras: List[float], alteracoes_locais: bool = False) -> None:
+        """Guarda as amostras de tempo (em segundos) de um ponto de entrada"""
+        agora = time.time()
+        self.conexao.executemany(
+            "INSERT INTO amostras VALUES (?, ?, ?, ?, ?)",
+            [(commit_id, int(alteracoes_locais), agora, ponto_entrada, s) for s in amostras])
+        self.conexao.commit()
+
+    def amostras(self, commit_id: str) -> Dict[str, List[float]]:
+        """
+        Amostras de cada ponto de entrada registradas para o commit.
+
+        Aceita prefixo do hash; com o sufixo '-dirty', seleciona as medições feitas com alterações
+        locais. Um prefixo que corresponde a mais de um commit gera ValueError.
+        """
+        alteracoes = commit_id.endswith(SUFIXO_ALTERACOES)
+        prefixo = commit_id[:-len(SUFIXO_ALTERACOES)] if alteracoes else commit_id
+        encontrados = [c for (c,) in self.conexao.execute(
+            "SELECT DISTINCT commit_id FROM amostras WHERE commit_id LIKE ? || '%' AND alteracoes_locais = ?",
+            (prefixo, int(alteracoes)))]
+        if len(encontrados) > 1:
+            raise ValueError(f"Prefixo '{prefixo}' ambíguo: corresponde a {len(encontrados)} commits")
+
+        linhas = self.conexao.execute(
+            "SELECT ponto_entrada, segundos FROM amostras WHERE commit_id = ? AND alteracoes_locais = ?",
+            (encontrados[0], int(alteracoes))) if encontrados else []
+        resultado: Dict[str, List[float]] = {}
+        for ponto_entrada, segundos in linhas:
+            resultado.setdefault(ponto_entrada, []).append(segundos)
+        return resultado
+
+    def commits(self) -> List[str]:
+        """Commits com amostras, do mais antigo para o mais recente ('<commit>-dirty' com alterações locais)"""
+        linhas = self.conexao.execute(
+            "SELECT commit_id, alteracoes_locais FROM amostras GROUP BY commit_id, alteracoes_locais "
+            "ORDER BY MAX(registrado_em)")
+        return [commit_id + (SUFIXO_ALTERACOES if alteracoes else "") for commit_id, alteracoes in linhas]
+
+    def fechar(self) -> None:
+        self.conexao.close()
+
+
+def teste_permutacao(base: List[float], atual: List[float], max_permutacoes: int = 20000) -> float:
+    """
+    p-valor unilateral de um teste de permutação para 'atual ser mais lento que base'
+    (diferença das médias). Enumera todas as permutações quando são poucas.
+    """
+    dados = np.array(base + atual)
+    n_base = len(base)
+    observado = np.mean(atual) - np.mean(base)
+
+    if math.comb(len(dados), n_base) <= max_permutacoes:
+        grupos = (list(c) for c in itertools.combinations(range(len(dados)), n_base))
+    else:
+        rng = np.random.default_rng(0)
+        grupos = (rng.permutation(len(dados))[:n_base] for _ in range(max_permutacoes))
+
+    total = extremos = 0
+    soma = dados.sum()
+    for indices in grupos:
+        soma_base = dados[indices].sum()
+        diferenca = (soma - soma_base) / (len(dados) - n_base) - soma_base / n_base
+        extremos += diferenca >= observado - 1e-15
+        total += 1
+
+    return float(extremos / total)
+
+
+def comparar(base: Dict[str, List[float]], atual: Dict[str, List[float]], limite: float = 0.05,
+             alfa: float = 0.05) -> List[dict]:
+    """
+    Compara as amostras de dois commits por ponto de entrada.
+
+    Uma regressão é sinalizada quando a mediana atual é mais de 'limite' (relativo) maior que a
+    da base e o teste de permutação rejeita a igualdade ao nível 'alfa'.
+    """
+    comparacoes = []
+    for ponto_entrada in sorted(set(base) & set(atual)):
+        mediana_base = float(np.median(base[ponto_entrada]))
+        mediana_atual = float(np.median(atual[ponto_entrada]))
+        razao = mediana_atual / mediana_base
+        p_valor = teste_permutacao(base[ponto_entrada], atual[ponto_entrada])
+
+        comparacoes.append({
+            'ponto_entrada': ponto_entrada,
+            'mediana_base_s': mediana_base,
+            'mediana_atual_s': mediana_atual,
+            'razao': razao,
+            'p_valor': p_valor,
+            'regressao': bool(razao > 1 + limite and p_valor < alfa),
+        })
+    return comparacoes
+
+
+def commit_atual() -> Tuple[str, bool]:
+    """Hash do HEAD e se há alterações locais não commitadas"""
+    try:
+        commit_id = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecido", False
+    return commit_id, bool(status.strip())
+
+
+def medir_pontos_de_entrada(nomes: List[str], repeticoes: int) -> Dict[str, List[float]]:
+    """Mede cada ponto de entrada 'repeticoes' vezes (a saída no terminal é descartada)"""
+    resultado = {}
+    for nome in nomes:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.ExitStack() as pilha:
+            executar = PONTOS_DE_ENTRADA[nome](pilha)
+            amostras = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                executar()
+                amostras.append(time.perf_counter() - inicio)
+        resultado[nome] = amostras
+    return resultado
+
+
+def _abreviar(commit_id: str) -> str:
+    """Hash abreviado para exibição, mantendo o sufixo '-dirty'"""
+    if commit_id.endswith(SUFIXO_ALTERACOES):
+        return commit_id[:-len(SUFIXO_ALTERACOES)][:10] + SUFIXO_ALTERACOES
+    return commit_id[:10]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Histórico de desempenho por commit")
+    parser.add_argument('--banco', default=ARQUIVO_PADRAO, help="Arquivo SQLite do histórico")
+    comandos = parser.add_subparsers(dest='comando', required=True)
+
+    registrar = comandos.add_parser('registrar', help="Mede os pontos de entrada e guarda no histórico")
+    registrar.add_argument('--repeticoes', type=int, default=5)
+    registrar.add_argument('--pontos', nargs='+', choices=list(PONTOS_DE_ENTRADA), default=list(PONTOS_DE_ENTRADA))
+
+    comparar_cmd = comandos.add_parser('comparar', help="Compara dois commits e falha se houver regressão")
+    comparar_cmd.add_argument('--base', help="Commit de referência (padrão: o penúltimo registrado)")
+    comparar_cmd.add_argument('--atual', help="Commit comparado; '<commit>-dirty' para alterações locais (padrão: o último registrado)")
+    comparar_cmd.add_argument('--limite', type=float, default=0.05, help="Aumento relativo tolerado da mediana")
+    comparar_cmd.add_argument('--alfa', type=float, default=0.05, help="Nível de significância")
+
+    args = parser.parse_args(argv)
+    historico = HistoricoDesempenho(args.banco)
+
+    try:
+        if args.comando == 'registrar':
+            commit_id, alteracoes = commit_atual()
+            for nome, amostras in medir_pontos_de_entrada(args.pontos, args.repeticoes).items():
+                historico.registrar(commit_id, nome, amostras, alteracoes)
+                print(f"{nome:26s} mediana = {np.median(amostras):.6f} s ({len(amostras)} amostras)")
+            print(f"Registrado para o commit {commit_id[:10]}" + (" (com alterações locais)" if alteracoes else ""))
+            return 0
+
+        commits = historico.commits()
+        atual = args.atual or (commits[-1] if commits else None)
+        base = args.base or (commits[-2] if len(commits) >= 2 else None)
+        if atual is None or base is None:
+            print("São necessários registros de dois commits para comparar.", file=sys.stderr)
+            return 2
+
+        try:
+            comparacoes = comparar(historico.amostras(base), historico.amostras(atual), args.limite, args.alfa)
+        except ValueError as erro:
+            print(erro, file=sys.stderr)
+            return 2
+        if not comparacoes:
+            print("Nenhum ponto de entrada em comum entre os dois commits.", file=sys.stderr)
+            return 2
+
+        print(f"Base: {_abreviar(base)}   Atual: {_abreviar(atual)}")
+        for c in comparacoes:
+            marca = "REGRESSAO" if c['regressao'] else "ok"
+            print(f"{c['ponto_entrada']:26s} {c['mediana_base_s']:.6f} s -> {c['mediana_atual_s']:.6f} s "
+                  f"({c['razao']:.2f}x, p = {c['p_valor']:.3f})  {marca}")
+        return 1 if any(c['regressao'] for c in comparacoes) else 0
+    finally:
+        historico.fechar()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Instrumentação das etapas de análise: tempo, chamadas de f, iterações, memória e resíduo
+
+Cada etapa medida gera um EstatisticasEtapa; o conjunto fica em um objeto Instrumentacao, que
+pode ser resumido no terminal ou exportado em JSON.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterator, List, Optional
+
+
+class ContadorChamadas:
+    """Envolve uma função e conta quantas vezes ela foi chamada"""
+
+    def __init__(self, funcao: Callable):
+        self.funcao = funcao
+        self.chamadas = 0
+
+    def __call__(self, *args, **kwargs):
+        self.chamadas += 1
+        return self.funcao(*args, **kwargs)
+
+
+@dataclass
+class EstatisticasEtapa:
+    """Medições de uma etapa"""
+    nome: str
+    tempo_s: float = 0.0                    # Tempo de parede
+    chamadas_f: int = 0                     # Avaliações do lado direito da EDO
+    iteracoes: int = 0                      # Iterações do método do Tiro
+    bytes_alocados: Optional[int] = None    # Pico de memória alocada durante a etapa (tracemalloc)
+    residuo: Optional[float] = None         # Resíduo final (ex.: y(b) - yb, erro na EDO)
+
+
+class Instrumentacao:
+    """
+    Coleta as estatísticas das etapas executadas.
+
+    Uso:
+        instrumentacao = Instrumentacao()
+        with instrumentacao.etapa('obs1') as estatisticas:
+            f = instrumentacao.contar(f)
+            ...
+            estatisticas.residuo = ...
+    """
+
+    def __init__(self, medir_memoria: bool = False):
+        """
+        Argumentos:
+        medir_memoria (bool): Se True, mede o pico de memória com tracemalloc. O rastreamento deixa a
+                              execução várias vezes mais lenta, e os tempos medidos junto com ele
+                              refletem esse custo; por isso fica desligado por padrão
+        """
+        self.medir_memoria = medir_memoria
+        self.etapas: List[EstatisticasEtapa] = []
+        self._contadores: List[ContadorChamadas] = []
+
+    @contextmanager
+    def etapa(self, nome: str) -> Iterator[EstatisticasEtapa]:
+        """Mede o bloco como uma etapa; as chamadas de funções envolvidas por contar() entram nela"""
+        estatisticas = EstatisticasEtapa(nome)
+        contadores_antes = len(self._contadores)
+
+        iniciou_tracemalloc = self.medir_memoria and not tracemalloc.is_tracing()
+        if iniciou_tracemalloc:
+            tracemalloc.start()
+        if self.medir_memoria:
+            base = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+
+        inicio = time.perf_counter()
+        try:
+            yield estatisticas
+        finally:
+            estatisticas.tempo_s = time.perf_counter() - inicio
+            if self.medir_memoria:
+                estatisticas.bytes_alocados = max(0, tracemalloc.get_traced_memory()[1] - base)
+            if iniciou_tracemalloc:
+                tracemalloc.stop()
+
+            estatisticas.chamadas_f += sum(c.chamadas for c in self._contadores[contadores_antes:])
+            del self._contadores[contadores_antes:]
+            self.etapas.append(estatisticas)
+
+    def contar(self, funcao: Callable) -> ContadorChamadas:
+        """Envolve a função para que suas chamadas sejam somadas à etapa em andamento"""
+        contador = ContadorChamadas(funcao)
+        self._contadores.append(contador)
+        return contador
+
+    def para_dict(self) -> dict:
+        """Estatísticas de todas as etapas, em tipos nativos (serializáveis em JSON)"""
+        return {
+            'etapas': [asdict(e) for e in self.etapas],
+            'tempo_total_s': sum(e.tempo_s for e in self.etapas),
+        }
+
+    def exportar_json(self, arquivo: str) -> None:
+        """Salva as estatísticas em um arquivo JSON"""
+        with open(arquivo, "w", encoding="utf-8") as saida:
+            json.dump(self.para_dict(), saida, indent=2)
+
+    def resumo(self) -> str:
+        """Tabela das etapas para o terminal"""
+        linhas = [f"{'Etapa':22s} {'Tempo (s)':>10s} {'Chamadas f':>11s} {'Iter.':>6s} {'Memória (KiB)':>14s} {'Resíduo':>10s}"]
+        for e in self.etapas:
+            memoria = f"{e.bytes_alocados / 1024:14.1f}" if e.bytes_alocados is not None else f"{'-':>14s}"
+            residuo = f"{e.residuo:10.2e}" if e.residuo is not None else f"{'-':>10s}"
+            linhas.append(f"{e.nome:22s} {e.tempo_s:10.4f} {e.chamadas_f:11d} {e.iteracoes:6d} {memoria} {residuo}")
+        return "\n".join(linhas)
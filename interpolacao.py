@@ -0,0 +1,112 @@
+"""
+Interpolação cúbica de Hermite de soluções (T, X) de EDOs
+
+Usa o estado X e sua derivada dX = f(T, X) nos pontos da malha. Para o cabo, X = [y, y'] e
+dX = [y', y''], de modo que y e y' podem ser avaliados em qualquer x sem integrar de novo.
+"""
+
+from typing import Callable, Optional
+
+import numpy as np
+
+
+def hermite_cubico(t0, x0, d0, t1, x1, d1, t, derivada: bool = False) -> np.ndarray:
+    """
+    Avalia o polinômio cúbico de Hermite definido em [t0, t1] por (x0, d0) e (x1, d1).
+
+    Os argumentos são combinados por broadcasting do numpy (o último eixo alinha com t).
+
+    Argumentos:
+    t0, t1: Extremos do intervalo
+    x0, x1: Valores nos extremos
+    d0, d1: Derivadas nos extremos
+    t: Pontos de avaliação
+    derivada (bool): Se True, retorna a derivada do interpolante em t
+
+    Retorna:
+    np.ndarray: Valores (ou derivadas) interpolados
+    """
+    dt = t1 - t0
+    s = (t - t0) / dt
+
+    if derivada:
+        # Derivadas das bases em relação a t (d/dt = (1/dt) d/ds)
+        h00 = 6 * s * (s - 1) / dt
+        h10 = (1 - s) * (1 - 3*s)
+        h01 = -h00
+        h11 = s * (3*s - 2)
+        return h00*x0 + h10*d0 + h01*x1 + h11*d1
+
+    h00 = (1 + 2*s) * (1 - s)**2
+    h10 = s * (1 - s)**2
+    h01 = s**2 * (3 - 2*s)
+    h11 = s**2 * (s - 1)
+    return h00*x0 + (h10*dt)*d0 + h01*x1 + (h11*dt)*d1
+
+
+class InterpoladorHermite:
+    """
+    Interpolante cúbico de Hermite por partes de uma solução (T, X) com derivadas dX.
+
+    Consultas são vetorizadas. Em malha uniforme o intervalo de cada ponto é obtido em O(1)
+    por divisão; em malha não uniforme, por busca binária (np.searchsorted, O(log n)).
+    """
+
+    def __init__(self, T: np.ndarray, X: np.ndarray, dX: np.ndarray):
+        """
+        Argumentos:
+        T (np.ndarray): Malha crescente com n >= 2 pontos
+        X (np.ndarray): Estados com forma (..., n)
+        dX (np.ndarray): Derivadas dos estados em T, mesma forma de X
+        """
+        self.T = np.asarray(T, dtype=float)
+        self.X = np.asarray(X, dtype=float)
+        self.dX = np.asarray(dX, dtype=float)
+
+        n = len(self.T)
+        if n < 2:
+            raise ValueError("A malha precisa de pelo menos 2 pontos")
+        if self.X.shape[-1] != n or self.dX.shape != self.X.shape:
+            raise ValueError(f"X e dX devem ter forma (..., {n}) compatível com T")
+
+        passos = np.diff(self.T)
+        if np.any(passos <= 0):
+            raise ValueError("T deve ser estritamente crescente")
+
+        # Malha uniforme: o passo é comparado com a média para tolerar erros de arredondamento de np.arange
+        h = (self.T[-1] - self.T[0]) / (n - 1)
+        self._h: Optional[float] = h if np.allclose(passos, h, rtol=1e-9, atol=0.0) else None
+
+    @classmethod
+    def da_solucao(cls, f: Callable, T: np.ndarray, X: np.ndarray) -> "InterpoladorHermite":
+        """
+        Constrói o interpolante de uma solução de x' = f(t, x), avaliando f uma vez em toda a malha.
+
+        f deve aceitar X com forma (m, n) (como ProblemaCabo.f), retornando as derivadas com a mesma forma.
+        """
+        return cls(T, X, np.asarray(f(T, X)))
+
+    def _intervalos(self, t: np.ndarray) -> np.ndarray:
+        """Índice i do intervalo [T[i], T[i+1]] de cada ponto (pontos fora de [T[0], T[-1]] lançam ValueError)"""
+        if np.any(t < self.T[0]) or np.any(t > self.T[-1]):
+            raise ValueError(f"Pontos de consulta fora de [{self.T[0]}, {self.T[-1]}]")
+
+        if self._h is not None:
+            i = ((t - self.T[0]) / self._h).astype(np.intp)
+        else:
+            i = np.searchsorted(self.T, t, side='right') - 1
+        return np.clip(i, 0, len(self.T) - 2)
+
+    def _avaliar(self, t, derivada: bool) -> np.ndarray:
+        t = np.asarray(t, dtype=float)
+        i = self._intervalos(t)
+        return hermite_cubico(self.T[i], self.X[..., i], self.dX[..., i],
+                              self.T[i + 1], self.X[..., i + 1], self.dX[..., i + 1], t, derivada)
+
+    def __call__(self, t) -> np.ndarray:
+        """Estado interpolado em t (escalar ou array), com forma X.shape[:-1] + t.shape"""
+        return self._avaliar(t, derivada=False)
+
+    def derivada(self, t) -> np.ndarray:
+        """Derivada do interpolante em t, com forma X.shape[:-1] + t.shape"""
+        return self._avaliar(t, derivada=True)
@@ -1,30 +1,27 @@
-from solvers_edo import SolverEDO
-from numerical_dif import NumericalDifferentiator
-from regressao import regressao_polinomial
-from gerador_pdf import gerar_pdf_relatorio
+from pipeline import PipelineCabo
+from cache_resultados import CacheResultados
+from instrumentacao import Instrumentacao
+import argparse
 import numpy as np
-import matplotlib.pyplot as plt
+import figuras
 
-def Obs1_Obs2():
+def Obs1_Obs2(pipeline=None):
+    """
+    Relatório das Obs.1 e Obs.2 no terminal, com gráficos
+
+    Args:
+        pipeline (PipelineCabo): Pipeline cujos resultados são usados (e reaproveitados depois)
+    """
     print("\n" + "="*80)
     print("RELATÓRIO DETALHADO - OBS.1 e OBS.2")
     print("="*80)
-    
-    C = 0.041
-
-    def f(t, y2):
-        y, w = y2
-        dydx = w
-        dwdx = C * np.sqrt(1.0 + w**2)
-        return np.array([dydx, dwdx])
 
-    a = 0.0
-    b = 20
-    h = 0.01
-    y0 = 15            # y(0) = 15
-    yb = 10            # y(20) = 10
-    chute1 = -5        # Chute inicial para y'(0)
-    chute2 = 10        # Segundo chute
+    if pipeline is None:
+        pipeline = PipelineCabo()
+    p = pipeline.problema
+    C, a, b, h = p.C, p.a, p.b, p.h
+    y0, yb = p.y0, p.yb
+    chute1, chute2 = p.chute1, p.chute2
 
     print("\nPARAMETROS DO PROBLEMA:")
     print(f"   Constante C = {C}")
@@ -36,7 +33,7 @@ def Obs1_Obs2():
     print("\nOBS.1: METODO DO TIRO COM RUNGE-KUTTA 4ª ORDEM")
     print("-" * 60)
     
-    T, X = SolverEDO.tiro(f, a, b, h, y0, yb, chute1, chute2, max_iter=10)
+    T, X = pipeline.resultado('obs1')
     
     # Estatísticas da solução
     n_pontos = len(T)
@@ -64,10 +61,7 @@ def Obs1_Obs2():
     print("-" * 60)
     
     # Aplicar diferenciação numérica
-    diff = NumericalDifferentiator(y_solucao, h)
-    d1_arr, d2_arr = diff.calculate_derivatives()
-    d1_arr = np.array(d1_arr)
-    d2_arr = np.array(d2_arr)
+    _, _, d1_arr, d2_arr, _ = pipeline.resultado('obs2')
     
     print(f"Diferenciacao numerica aplicada a {len(y_solucao)} pontos")
     print("Metodos utilizados:")
@@ -140,47 +134,36 @@ def Obs1_Obs2():
     print("="*80)
 
     # Plotagem de resultados
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-    # Gráfico 1: Solução y(x) e sua derivada primeira y'(x)
-    ax1.plot(T, y_solucao, 'b-', linewidth=2, label='y(x) - Solução')
-    ax1.plot(T, dy_solucao, 'r--', linewidth=2, label="y'(x) - 1ª Derivada")
-    ax1.plot(T, d1_arr, 'g:', linewidth=1, alpha=0.7, label="y'(x) - Numérica")
-    ax1.set_xlabel('x')
-    ax1.set_ylabel('y(x), y\'(x)')
-    ax1.set_title('Obs.1 e Obs.2: Solução e 1ª Derivada')
-    ax1.legend()
-    ax1.grid(True, linestyle='--', alpha=0.6)
-
-    # Gráfico 2: Segunda derivada e verificação da EDO
-    ax2.plot(T, d2_arr, 'b-', linewidth=2, label="y''(x) - 2ª Derivada Numérica")
-    ax2.plot(T, lado_direito_edo, 'r--', linewidth=2, label=f"C√(1+y'²) - Lado Direito EDO")
-    ax2.set_xlabel('x')
-    ax2.set_ylabel("y''(x)")
-    ax2.set_title('Obs.2: Verificação da EDO')
-    ax2.legend()
-    ax2.grid(True, linestyle='--', alpha=0.6)
-
-    # Ajusta o layout para evitar sobreposição e exibe o gráfico
-    plt.tight_layout(rect=[0, 0, 1, 0.95]) # Ajusta o retângulo para caber o suptitle
-    plt.show()
+    figuras.mostrar('obs1_obs2', T=T, y=y_solucao, dy=dy_solucao, d1=d1_arr, d2=d2_arr, lado_direito=lado_direito_edo)
     
     print("="*80)
 
-def main():
-    """Função principal que executa todas as análises"""
+def main(arquivo_estatisticas=None, medir_memoria=False):
+    """
+    Função principal que executa todas as análises
+
+    Args:
+        arquivo_estatisticas (str): Se fornecido, salva em JSON as estatísticas de cada etapa
+        medir_memoria (bool): Se True, mede também o pico de memória de cada etapa (tracemalloc,
+                              que torna os tempos medidos bem maiores)
+    """
     print("=" * 80)
     print("PROJETO DE MÉTODOS NUMÉRICOS - ANÁLISE DE CABO SUSPENSO")
     print("=" * 80)
     
+    # Cada etapa é calculada uma única vez e reaproveitada pelas seguintes e pelo PDF;
+    # a solução da Obs.1 também fica no cache em disco para as próximas execuções
+    instrumentacao = Instrumentacao(medir_memoria=medir_memoria)
+    pipeline = PipelineCabo(mostrar_graficos=True, cache=CacheResultados(), instrumentacao=instrumentacao)
+
     # Executar todas as observações
-    Obs1_Obs2()
+    Obs1_Obs2(pipeline)
     
     # Executa Obs.3
     print("\n" + "="*60)
     print("EXECUTANDO OBS.3 - REGRESSÃO POLINOMIAL")
     print("="*60)
-    regressao_polinomial()
+    pipeline.resultado('obs3')
     
     # Opção para gerar PDF
     print("\n" + "=" * 60)
@@ -192,9 +175,11 @@ def main():
     if resposta in ['s', 'sim', 'y', 'yes']:
         try:
             print("\nGerando relatório PDF...")
-            print("(Os cálculos serão executados novamente para o PDF, mas sem exibir gráficos)")
+            print("(Os resultados já calculados serão reaproveitados no PDF)")
             
-            nome_pdf = gerar_pdf_relatorio("resultado_metodos_numericos.pdf")
+            # Importado só aqui: o gerador carrega o reportlab, desnecessário quando o PDF não é pedido
+            from gerador_pdf import gerar_pdf_relatorio
+            nome_pdf = gerar_pdf_relatorio("resultado_metodos_numericos.pdf", pipeline)
             
             print(f"\nSUCESSO: Relatório PDF gerado com sucesso!")
             print(f"Arquivo: {nome_pdf}")
@@ -210,5 +195,19 @@ def main():
     else:
         print("Relatório PDF não será gerado.")
 
+    # Onde o tempo foi gasto em cada etapa
+    print("\n" + "=" * 60)
+    print("ESTATISTICAS DAS ETAPAS")
+    print("=" * 60)
+    print(instrumentacao.resumo())
+    if arquivo_estatisticas:
+        instrumentacao.exportar_json(arquivo_estatisticas)
+        print(f"Estatisticas salvas em {arquivo_estatisticas}")
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Projeto de Métodos Numéricos - Análise de Cabo Suspenso")
+    parser.add_argument('--estatisticas', metavar='ARQUIVO', help="Salva as estatísticas das etapas em JSON")
+    parser.add_argument('--memoria', action='store_true',
+                        help="Mede o pico de memória de cada etapa (tracemalloc; distorce os tempos)")
+    args = parser.parse_args()
+    main(args.estatisticas, args.memoria)
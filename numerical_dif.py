@@ -1,4 +1,56 @@
-from typing import List, Tuple
+import numpy as np
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+# Scalar or array of values (the private formulas accept either)
+Values = Union[float, np.ndarray]
+
+# Supported accuracy orders (the error of every formula is O(h^order))
+SUPPORTED_ORDERS = (2, 4, 6)
+
+
+def fornberg_weights(x0: np.ndarray, x: np.ndarray, max_derivative: int) -> np.ndarray:
+    """
+    Computes finite difference weights with Fornberg's algorithm.
+
+    The weights are computed for many stencils at once: x0 holds the evaluation points
+    and each row of x holds the (distinct) nodes of the corresponding stencil.
+
+    Args:
+        x0 (np.ndarray): Evaluation points, shape (m,).
+        x (np.ndarray): Stencil nodes, shape (m, s).
+        max_derivative (int): Highest derivative order to compute weights for.
+
+    Returns:
+        np.ndarray: Weights with shape (max_derivative + 1, m, s); entry [d, i, j] multiplies
+                    f(x[i, j]) in the approximation of the d-th derivative at x0[i].
+    """
+    x0 = np.asarray(x0, dtype=float)
+    x = np.asarray(x, dtype=float)
+    s = x.shape[-1]
+    c = np.zeros((max_derivative + 1,) + x.shape)
+
+    c1 = np.ones_like(x0)
+    c4 = x[..., 0] - x0
+    c[0, ..., 0] = 1.0
+    for i in range(1, s):
+        mn = min(i, max_derivative)
+        c2 = np.ones_like(x0)
+        c5 = c4
+        c4 = x[..., i] - x0
+        for j in range(i):
+            c3 = x[..., i] - x[..., j]
+            c2 = c2 * c3
+            if j == i - 1:
+                for k in range(mn, 0, -1):
+                    c[k, ..., i] = c1 * (k * c[k - 1, ..., i - 1] - c5 * c[k, ..., i - 1]) / c2
+                c[0, ..., i] = -c1 * c5 * c[0, ..., i - 1] / c2
+            for k in range(mn, 0, -1):
+                c[k, ..., j] = (c4 * c[k, ..., j] - k * c[k - 1, ..., j]) / c3
+            c[0, ..., j] = c4 * c[0, ..., j] / c3
+        c1 = c2
+
+    return c
+
 
 class NumericalDifferentiator:
     """
@@ -9,83 +61,241 @@ class NumericalDifferentiator:
     based on the data point's position to maintain accuracy across the entire set.
     """
 
-    def __init__(self, y_values: List[float], step_size: float):
+    def __init__(self, y_values: Union[Sequence[float], np.ndarray], step_size: Optional[float] = None,
+                 order: int = 2, x_values: Optional[Union[Sequence[float], np.ndarray]] = None):
         """
         Initializes the differentiator with the dataset and step size.
 
         Args:
-            y_values (List[float]): A list of y-values for the function f(x).
+            y_values (Sequence[float] | np.ndarray): The y-values for the function f(x).
+                                                     Float arrays are used as-is, without a copy.
             step_size (float): The constant distance 'h' between x-values.
+            order (int): Accuracy order of the formulas: 2, 4 or 6 (O(h^order) error).
+            x_values (Sequence[float] | np.ndarray): Strictly increasing x-values for a
+                                                     non-uniform grid (instead of step_size).
         """
-        if len(y_values) < 4:
-            raise ValueError("Input y_values must contain at least 4 points.")
-        if step_size <= 0:
+        if order not in SUPPORTED_ORDERS:
+            raise ValueError(f"Order must be one of {SUPPORTED_ORDERS}.")
+        if len(y_values) < max(4, order + 2):
+            raise ValueError(f"Input y_values must contain at least {max(4, order + 2)} points.")
+        if (step_size is None) == (x_values is None):
+            raise ValueError("Provide exactly one of step_size or x_values.")
+        if step_size is not None and step_size <= 0:
             raise ValueError("Step size 'h' must be positive.")
-            
-        self.y = y_values
+
+        self.y = np.asarray(y_values, dtype=float)
         self.h = step_size
         self.n = len(y_values)
+        self.order = order
+        self.x = None
+
+        if x_values is not None:
+            self.x = np.asarray(x_values, dtype=float)
+            if len(self.x) != self.n:
+                raise ValueError("x_values and y_values must have the same length.")
+            if np.any(np.diff(self.x) <= 0):
+                raise ValueError("x_values must be strictly increasing.")
+
+        # Stencil weights for uniform grids do not depend on the data: compute them once
+        self._weights: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        if self.x is None and order != 2:
+            self._weights = {d: self._uniform_weights(d) for d in (1, 2)}
 
     # --- Public Method ---
 
-    def calculate_derivatives(self) -> Tuple[List[float], List[float]]:
+    def calculate_derivatives(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Computes the first and second derivatives for all points in the dataset.
 
+        Interior points are computed all at once with array slicing; the forward and
+        backward formulas are only applied near the two ends. Orders 4 and 6 and
+        non-uniform grids use stencil weights from Fornberg's algorithm.
+
         Returns:
-            Tuple[List[float], List[float]]: A tuple containing two lists:
-                                             - The first list holds the first derivatives.
-                                             - The second list holds the second derivatives.
+            Tuple[np.ndarray, np.ndarray]: A tuple containing two arrays:
+                                           - The first array holds the first derivatives.
+                                           - The second array holds the second derivatives.
         """
-        first_derivatives: List[float] = []
-        second_derivatives: List[float] = []
-
-        for i in range(self.n):
-            if i == 0:
-                # Use forward difference for the first point
-                d1 = self._forward_first_derivative(self.y[0], self.y[1], self.y[2])
-                d2 = self._forward_second_derivative(self.y[0], self.y[1], self.y[2], self.y[3])
-            elif i == self.n - 1:
-                # Use backward difference for the last point
-                d1 = self._backward_first_derivative(self.y[i-2], self.y[i-1], self.y[i])
-                d2 = self._backward_second_derivative(self.y[i-3], self.y[i-2], self.y[i-1], self.y[i])
-            else:
-                # Use central difference for all interior points
-                d1 = self._central_first_derivative(self.y[i-1], self.y[i+1])
-                d2 = self._central_second_derivative(self.y[i-1], self.y[i], self.y[i+1])
-            
-            first_derivatives.append(d1)
-            second_derivatives.append(d2)
-            
+        if self.x is not None:
+            return self._nonuniform_derivative(1), self._nonuniform_derivative(2)
+        if self.order != 2:
+            return self._uniform_derivative(1), self._uniform_derivative(2)
+
+        y = self.y
+        first_derivatives = np.empty(self.n)
+        second_derivatives = np.empty(self.n)
+
+        # Use central difference for all interior points
+        first_derivatives[1:-1] = self._central_first_derivative(y[:-2], y[2:])
+        second_derivatives[1:-1] = self._central_second_derivative(y[:-2], y[1:-1], y[2:])
+
+        # Use forward difference for the first point
+        first_derivatives[0] = self._forward_first_derivative(y[0], y[1], y[2])
+        second_derivatives[0] = self._forward_second_derivative(y[0], y[1], y[2], y[3])
+
+        # Use backward difference for the last point
+        first_derivatives[-1] = self._backward_first_derivative(y[-3], y[-2], y[-1])
+        second_derivatives[-1] = self._backward_second_derivative(y[-4], y[-3], y[-2], y[-1])
+
         return first_derivatives, second_derivatives
 
     # --- Private Methods  ---
 
-    def _forward_first_derivative(self, y0: float, y1: float, y2: float) -> float:
+    def _stencil(self, i: int, derivative: int) -> np.ndarray:
+        """Indices of the stencil used at point i (central inside, one-sided near the ends)."""
+        r = self.order // 2
+        if r <= i < self.n - r:
+            return np.arange(i - r, i + r + 1)
+        width = self.order + derivative
+        start = 0 if i < r else self.n - width
+        return np.arange(start, start + width)
+
+    def _uniform_weights(self, derivative: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Weights (for h = 1) of the central stencil and of the one-sided stencils at each end."""
+        r = self.order // 2
+        central = fornberg_weights(np.zeros(1), np.arange(-r, r + 1)[None, :], derivative)[derivative, 0]
+
+        width = self.order + derivative
+        nodes = np.tile(np.arange(width, dtype=float), (r, 1))
+        forward = fornberg_weights(np.arange(r, dtype=float), nodes, derivative)[derivative]
+        backward = fornberg_weights(np.arange(width - r, width, dtype=float), nodes, derivative)[derivative]
+        return central, forward, backward
+
+    def _uniform_derivative(self, derivative: int) -> np.ndarray:
+        """Applies the precomputed uniform-grid weights to the whole dataset."""
+        central, forward, backward = self._weights[derivative]
+        r = self.order // 2
+        y, n = self.y, self.n
+        result = np.zeros(n)
+
+        for k, w in enumerate(central):
+            result[r:n - r] += w * y[k:n - 2 * r + k]
+
+        width = forward.shape[1]
+        result[:r] = forward @ y[:width]
+        result[n - r:] = backward @ y[n - width:]
+
+        return result / self.h ** derivative
+
+    def _nonuniform_derivative(self, derivative: int) -> np.ndarray:
+        """Computes the derivative on a non-uniform grid, with weights for every point."""
+        r = self.order // 2
+        x, y, n = self.x, self.y, self.n
+        result = np.empty(n)
+
+        # Interior points share the same stencil shape, so their weights are computed together
+        idx = np.arange(r, n - r)[:, None] + np.arange(-r, r + 1)[None, :]
+        weights = fornberg_weights(x[r:n - r], x[idx], derivative)[derivative]
+        result[r:n - r] = np.sum(weights * y[idx], axis=1)
+
+        for i in list(range(r)) + list(range(n - r, n)):
+            stencil = self._stencil(i, derivative)
+            w = fornberg_weights(x[i:i + 1], x[stencil][None, :], derivative)[derivative, 0]
+            result[i] = w @ y[stencil]
+
+        return result
+
+
+    def _forward_first_derivative(self, y0: Values, y1: Values, y2: Values) -> Values:
         """Formula for 1st derivative at the start of the data. O(h^2)"""
         return (-3*y0 + 4*y1 - y2) / (2 * self.h)
 
-    def _backward_first_derivative(self, y0: float, y1: float, y2: float) -> float:
+    def _backward_first_derivative(self, y0: Values, y1: Values, y2: Values) -> Values:
         """Formula for 1st derivative at the end of the data. O(h^2)"""
         return (y0 - 4*y1 + 3*y2) / (2 * self.h)
 
-    def _central_first_derivative(self, y_prev: float, y_next: float) -> float:
+    def _central_first_derivative(self, y_prev: Values, y_next: Values) -> Values:
         """Formula for 1st derivative at interior points. O(h^2)"""
         return (y_next - y_prev) / (2 * self.h)
 
-    def _forward_second_derivative(self, y0: float, y1: float, y2: float, y3: float) -> float:
+    def _forward_second_derivative(self, y0: Values, y1: Values, y2: Values, y3: Values) -> Values:
         """Formula for 2nd derivative at the start of the data. O(h^2)"""
         return (2*y0 - 5*y1 + 4*y2 - y3) / (self.h ** 2)
 
-    def _backward_second_derivative(self, y0: float, y1: float, y2: float, y3: float) -> float:
+    def _backward_second_derivative(self, y0: Values, y1: Values, y2: Values, y3: Values) -> Values:
         """Formula for 2nd derivative at the end of the data. O(h^2)"""
         return (-y0 + 4*y1 - 5*y2 + 2*y3) / (self.h ** 2)
 
-    def _central_second_derivative(self, y_prev: float, y_current: float, y_next: float) -> float:
+    def _central_second_derivative(self, y_prev: Values, y_current: Values, y_next: Values) -> Values:
         """Formula for 2nd derivative at interior points. O(h^2)"""
         return (y_next - 2*y_current + y_prev) / (self.h ** 2)
 
 
+class StreamingDifferentiator:
+    """
+    Calculates the first and second numerical derivatives of a dataset that arrives in chunks.
+
+    The data can be any iterable of 1-D chunks (e.g. a generator reading from disk) or a single
+    array such as an ``np.memmap``, which is read in slices of ``chunk_size`` points. Only a small
+    halo of points is kept between chunks, so memory use does not depend on the dataset length.
+    The results are the same as ``NumericalDifferentiator`` on the whole (uniform) dataset,
+    including the forward and backward formulas at the global ends.
+    """
+
+    def __init__(self, step_size: float, order: int = 2, chunk_size: int = 1_000_000):
+        """
+        Initializes the streaming differentiator.
+
+        Args:
+            step_size (float): The constant distance 'h' between x-values.
+            order (int): Accuracy order of the formulas: 2, 4 or 6 (O(h^order) error).
+            chunk_size (int): Number of points read at a time when the input is an array.
+        """
+        if step_size <= 0:
+            raise ValueError("Step size 'h' must be positive.")
+        if order not in SUPPORTED_ORDERS:
+            raise ValueError(f"Order must be one of {SUPPORTED_ORDERS}.")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive.")
+
+        self.h = step_size
+        self.order = order
+        self.chunk_size = chunk_size
+
+    # --- Public Method ---
+
+    def differentiate(self, chunks: Union[Iterable[Sequence[float]], np.ndarray]) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Computes the first and second derivatives chunk by chunk.
+
+        Args:
+            chunks (Iterable | np.ndarray): The y-values, as an iterable of 1-D chunks or as one array.
+
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: Consecutive chunks of the first and second derivatives.
+                                           Their sizes may differ from the input chunks.
+        """
+        if isinstance(chunks, np.ndarray):
+            data = chunks
+            chunks = (data[i:i + self.chunk_size] for i in range(0, len(data), self.chunk_size))
+
+        r = self.order // 2
+        min_points = max(4, self.order + 2)
+        # Points kept between chunks: enough for the central stencil of the next point to be
+        # emitted and for the backward stencils at the global end
+        halo = max(2 * r, min_points)
+
+        buffer = np.empty(0)
+        first = 0    # Position in the buffer of the first point whose derivative is still pending
+
+        for chunk in chunks:
+            buffer = np.concatenate([buffer, np.atleast_1d(np.asarray(chunk, dtype=float))])
+            if len(buffer) < max(min_points, halo + 1):
+                continue
+
+            # Points with a complete central stencil (or at the global start) are final
+            last = len(buffer) - r
+            d1, d2 = NumericalDifferentiator(buffer, self.h, order=self.order).calculate_derivatives()
+            yield d1[first:last], d2[first:last]
+
+            buffer = buffer[len(buffer) - halo:]
+            first = halo - r
+
+        if len(buffer) - first > 0:
+            # The remaining points include the global end (backward formulas)
+            d1, d2 = NumericalDifferentiator(buffer, self.h, order=self.order).calculate_derivatives()
+            yield d1[first:], d2[first:]
+
 
 if __name__ == "__main__":
     y_data = [0.0, 1.0, 8.0, 27.0, 64.0]
@@ -101,8 +311,28 @@ if __name__ == "__main__":
         # 3. Print the results
         print("Original Y Values: ", y_data)
         print("-" * 30)
-        print("Calculated 1st Derivatives:", [round(val, 2) for val in first_derivative])
-        print("Calculated 2nd Derivatives:", [round(val, 2) for val in second_derivative])
+        print("Calculated 1st Derivatives:", np.round(first_derivative, 2))
+        print("Calculated 2nd Derivatives:", np.round(second_derivative, 2))
 
     except ValueError as e:
-        print(f"Error: {e}")
\ No newline at end of file
+        print(f"Error: {e}")
+
+    # Streaming check: every chunk size (and ragged chunks from a generator) must reproduce the
+    # whole-array results, including the halo handling at chunk boundaries and the global ends
+    for order in SUPPORTED_ORDERS:
+        for n_points in range(max(4, order + 2), 30):
+            y = np.sin(np.linspace(0.0, 3.0, n_points))
+            expected = NumericalDifferentiator(y, 0.1, order=order).calculate_derivatives()
+
+            inputs = [(size, y) for size in (1, 2, 3, 5, 7, n_points)]
+            ragged = (y[i:j] for i, j in zip([0, 1, 3, 6, 10, 15, 21], [1, 3, 6, 10, 15, 21, n_points]) if i < n_points)
+            inputs.append((n_points, ragged))
+
+            for size, data in inputs:
+                chunks = list(StreamingDifferentiator(0.1, order=order, chunk_size=size).differentiate(data))
+                for k in range(2):
+                    result = np.concatenate([chunk[k] for chunk in chunks])
+                    assert np.allclose(result, expected[k], rtol=0, atol=1e-12), \
+                        f"Streaming mismatch (order={order}, n={n_points}, chunk_size={size}, derivative {k + 1})"
+
+    print("StreamingDifferentiator: streaming results match the whole-array results")
@@ -0,0 +1,127 @@
+"""
+Pipeline das observações do projeto: Obs.1 (Tiro + RK4) -> Obs.2 (diferenciação) e Obs.3 (regressão)
+
+Cada etapa é calculada uma única vez e reaproveitada por todas as etapas e consumidores que
+dependem dela (relatório no terminal, gráficos e PDF).
+"""
+
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from cabo import ProblemaCabo
+from cache_resultados import CacheResultados
+from instrumentacao import Instrumentacao
+from interpolacao import InterpoladorHermite
+from solvers_edo import SolverEDO
+from numerical_dif import NumericalDifferentiator
+from regressao import regressao_polinomial
+
+
+class PipelineCabo:
+    """
+    Grafo de dependências das etapas de análise do cabo suspenso, com resultados memorizados.
+
+    Etapas:
+    obs1: (T, X) do método do Tiro com RK4
+    obs2: (T, X, y'_num, y''_num, erro_edo) da diferenciação numérica de obs1
+    obs3: dicionário de regressao_polinomial aplicada a obs1
+    """
+
+    # Etapa -> etapas das quais depende
+    DEPENDENCIAS: Dict[str, Tuple[str, ...]] = {
+        'obs1': (),
+        'obs2': ('obs1',),
+        'obs3': ('obs1',),
+    }
+
+    def __init__(self, problema: Optional[ProblemaCabo] = None, mostrar_graficos: bool = False,
+                 cache: Optional[CacheResultados] = None, instrumentacao: Optional[Instrumentacao] = None):
+        """
+        Argumentos:
+        problema (ProblemaCabo): Parâmetros do problema (padrão: os do enunciado)
+        mostrar_graficos (bool): Se True, a Obs.3 exibe seus gráficos ao ser calculada
+        cache (CacheResultados): Cache em disco para a solução da Obs.1 (se None, sempre resolve)
+        instrumentacao (Instrumentacao): Se fornecida, registra as estatísticas de cada etapa calculada
+        """
+        self.problema = problema if problema is not None else ProblemaCabo()
+        self.mostrar_graficos = mostrar_graficos
+        self.cache = cache
+        self.instrumentacao = instrumentacao
+        self._resultados: Dict[str, Any] = {}
+
+    def resultado(self, etapa: str) -> Any:
+        """Retorna o resultado da etapa, calculando antes (uma única vez) as etapas de que ela depende"""
+        if etapa not in self.DEPENDENCIAS:
+            raise KeyError(f"Etapa desconhecida: {etapa}")
+
+        if etapa not in self._resultados:
+            entradas = [self.resultado(dep) for dep in self.DEPENDENCIAS[etapa]]
+            calcular: Callable = getattr(self, f"_calcular_{etapa}")
+            if self.instrumentacao is None:
+                self._resultados[etapa] = calcular(*entradas)
+            else:
+                with self.instrumentacao.etapa(etapa) as estatisticas:
+                    self._resultados[etapa] = calcular(*entradas, estatisticas=estatisticas)
+
+        return self._resultados[etapa]
+
+    def interpolante(self) -> InterpoladorHermite:
+        """Interpolante cúbico de Hermite da solução da Obs.1: y e y' em qualquer x de [a, b] sem integrar de novo"""
+        T, X = self.resultado('obs1')
+        return InterpoladorHermite.da_solucao(self.problema.f, T, X)
+
+    def executar(self) -> Dict[str, Any]:
+        """Calcula todas as etapas e retorna os resultados por nome"""
+        return {etapa: self.resultado(etapa) for etapa in self.DEPENDENCIAS}
+
+    # --- Etapas ---
+    # Com instrumentação, cada etapa recebe o EstatisticasEtapa em que registra contadores e resíduo
+
+    def _calcular_obs1(self, estatisticas=None):
+        if self.cache is None:
+            return self._resolver_obs1(estatisticas)
+
+        p = self.problema
+        chave = CacheResultados.chave(problema=asdict(p), solver='SolverEDO.tiro')
+        solucao = self.cache.obter(chave)
+        if solucao is None:
+            T, X = self._resolver_obs1(estatisticas)
+            self.cache.salvar(chave, T, X, metadados={'problema': asdict(p)})
+            solucao = self.cache.obter(chave)
+        elif estatisticas is not None:
+            estatisticas.residuo = float(solucao[1][0, -1] - p.yb)
+        return solucao
+
+    def _resolver_obs1(self, estatisticas=None):
+        p = self.problema
+        if estatisticas is None:
+            return SolverEDO.tiro(p.f, p.a, p.b, p.h, p.y0, p.yb, p.chute1, p.chute2, tol=p.tol, max_iter=p.max_iter,
+                                  metodo=p.metodo, jac=p.jac)
+
+        info = {}
+        T, X = SolverEDO.tiro(self.instrumentacao.contar(p.f), p.a, p.b, p.h, p.y0, p.yb, p.chute1, p.chute2,
+                              tol=p.tol, max_iter=p.max_iter, info=info, metodo=p.metodo, jac=p.jac)
+        estatisticas.iteracoes = info['iteracoes']
+        estatisticas.residuo = info['residuo']
+        return T, X
+
+    def _calcular_obs2(self, obs1, estatisticas=None):
+        T, X = obs1
+        h = T[1] - T[0]
+
+        y_prime_num, y_double_prime_num = NumericalDifferentiator(X[0], h).calculate_derivatives()
+
+        lado_direito_edo = self.problema.C * np.sqrt(1.0 + y_prime_num**2)
+        erros_edo = np.abs(y_double_prime_num - lado_direito_edo)
+
+        if estatisticas is not None:
+            estatisticas.residuo = float(np.sqrt(np.mean(erros_edo**2)))
+        return T, X, y_prime_num, y_double_prime_num, erros_edo
+
+    def _calcular_obs3(self, obs1, estatisticas=None):
+        resultado = regressao_polinomial(mostrar_graficos=self.mostrar_graficos, problema=self.problema, solucao=obs1)
+        if estatisticas is not None:
+            estatisticas.residuo = float(resultado['erro_medio'])
+        return resultado
@@ -1,17 +1,20 @@
 from solvers_edo import SolverEDO
+from cabo import ProblemaCabo
 import numpy as np
-import matplotlib.pyplot as plt
+import figuras
 from numpy.polynomial import Polynomial
 
-def regressao_polinomial(mostrar_graficos=True):
+def regressao_polinomial(mostrar_graficos=True, problema=None, solucao=None):
     """
     Obs.3: Regressão polinomial de quarto grau e verificação da EDO
     
     Args:
         mostrar_graficos (bool): Se True, exibe os gráficos. Se False, apenas calcula.
+        problema (ProblemaCabo): Parâmetros do problema (padrão: os do enunciado)
+        solucao (tuple): (T, X) já calculados pelo método do Tiro; se None, a EDO é resolvida aqui
     
     Passos:
-    1. Resolver a EDO usando RK4 + Tiro (mesmo da Obs.1)
+    1. Resolver a EDO usando RK4 + Tiro (mesmo da Obs.1), se a solução não for fornecida
     2. Obter conjunto de pares ordenados (x, y)
     3. Fazer regressão polinomial de grau 4
     4. Calcular derivadas analíticas do polinômio
@@ -19,24 +22,18 @@ def regressao_polinomial(mostrar_graficos=True):
     """
     
     # --- Passo 1: Resolver a EDO (mesmo da Obs.1) ---
-    C = 0.041
+    if problema is None:
+        problema = ProblemaCabo()
+    C = problema.C
 
-    def f(t, y2):
-        y, w = y2
-        dydx = w
-        dwdx = C * np.sqrt(1.0 + w**2)
-        return np.array([dydx, dwdx])
-
-    a = 0.0
-    b = 20
-    h = 0.01
-    y0 = 15            # y(0) = 15
-    yb = 10            # y(20) = 10
-    chute1 = -5        # Chute inicial para y'(0)
-    chute2 = 10        # Segundo chute
-
-    print("==> Resolvendo EDO usando RK4 + Tiro...")
-    T, X = SolverEDO.tiro(f, a, b, h, y0, yb, chute1, chute2, max_iter=10)
+    if solucao is None:
+        print("==> Resolvendo EDO usando RK4 + Tiro...")
+        p = problema
+        T, X = SolverEDO.tiro(p.f, p.a, p.b, p.h, p.y0, p.yb, p.chute1, p.chute2, tol=p.tol, max_iter=p.max_iter,
+                              metodo=p.metodo, jac=p.jac)
+    else:
+        print("==> Usando solucao da EDO ja calculada (RK4 + Tiro)...")
+        T, X = solucao
     
     # --- Passo 2: Obter pares ordenados (x, y) ---
     x_data = T           # Pontos x (domínio)
@@ -101,51 +98,11 @@ def regressao_polinomial(mostrar_graficos=True):
     if mostrar_graficos:
         print("\n==> Gerando graficos de verificacao...")
         
-        fig, axs = plt.subplots(3, 1, figsize=(15, 16))
-        fig.suptitle('Obs.3: Regressão Polinomial de Grau 4 e Verificação da EDO', fontsize=16, fontweight='bold')
-        
-        # --- Gráfico 1: Comparação solução original vs polinômio ---
-        ax1 = axs[0]
-        ax1.plot(x_data, y_data, 'b-', linewidth=2, label='Solução Original (RK4+Tiro)')
-        ax1.plot(x_data, y_poly, 'r--', linewidth=2, label='Polinômio de Grau 4')
-        ax1.set_ylabel('y(x)')
-        ax1.set_title(f'Comparação: Solução Original vs Regressão Polinomial (R² = {r_squared:.4f})')
-        ax1.legend()
-        ax1.grid(True, alpha=0.6)
-        
-        # --- Gráfico 2: Derivadas do polinômio ---
-        ax2 = axs[1]
-        ax2.plot(x_data, y_poly, 'k-', linewidth=2, label='P(x) - Polinômio')
-        ax2.plot(x_data, dy_poly, 'g--', linewidth=2, label="P'(x) - 1ª Derivada")
-        ax2.plot(x_data, d2y_poly, 'r:', linewidth=2, label="P''(x) - 2ª Derivada")
-        ax2.set_ylabel('Valor')
-        ax2.set_title('Polinômio e suas Derivadas Analíticas')
-        ax2.legend()
-        ax2.grid(True, alpha=0.6)
-        
-        # --- Gráfico 3: Verificação da EDO ---
-        ax3 = axs[2]
-        ax3.plot(x_data, d2y_poly, 'b-', linewidth=3, label="Lado Esquerdo: P''(x)")
-        ax3.plot(x_data, lado_direito_edo, 'r--', linewidth=2, label="Lado Direito: C√(1 + P'(x)²)")
-        ax3.set_xlabel('x (Posição Horizontal)')
-        ax3.set_ylabel('Valor da Curvatura')
-        ax3.set_title(f'Verificação da EDO (Erro Médio: {erro_medio:.2e})')
-        ax3.legend()
-        ax3.grid(True, alpha=0.6)
-        
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
-        plt.show()
-        
+        figuras.mostrar('regressao', x=x_data, y=y_data, y_poly=y_poly, dy_poly=dy_poly, d2y_poly=d2y_poly,
+                        lado_direito=lado_direito_edo, r_squared=r_squared, erro_medio=erro_medio)
+
         # --- Gráfico adicional: Erro absoluto ---
-        plt.figure(figsize=(12, 6))
-        plt.plot(x_data, erro_edo, 'r-', linewidth=2)
-        plt.xlabel('x (Posição Horizontal)')
-        plt.ylabel('Erro Absoluto |P\'\'(x) - C√(1 + P\'(x)²)|')
-        plt.title(f'Erro na Satisfação da EDO pelo Polinômio de Grau 4\n(Erro Médio: {erro_medio:.2e}, Erro Máximo: {erro_maximo:.2e})')
-        plt.grid(True, alpha=0.6)
-        plt.yscale('log')  # Escala logarítmica para melhor visualização
-        plt.tight_layout()
-        plt.show()
+        figuras.mostrar('erro_regressao', x=x_data, erro_edo=erro_edo, erro_medio=erro_medio, erro_maximo=erro_maximo)
     else:
         print("\n==> Graficos suprimidos para geracao de PDF...")
     
@@ -0,0 +1,91 @@
+"""
+Solução analítica do problema do cabo: d²y/dx² = C * sqrt(1 + (dy/dx)²)
+
+Com w = y', a EDO fica w' = C * sqrt(1 + w²), cuja solução é w = sinh(C x + c1); integrando,
+y = cosh(C x + c1) / C + c2 (catenária). As constantes vêm das condições de contorno ou iniciais.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from cabo import ProblemaCabo
+
+
+class SolucaoAnaliticaCabo:
+    """
+    Catenária y(x) = cosh(C x + c1) / C + c2, avaliada de forma vetorizada em qualquer malha.
+
+    C, c1 e c2 podem ser arrays (várias configurações de uma vez); a avaliação em x segue as
+    regras de broadcasting do numpy.
+    """
+
+    def __init__(self, C, c1, c2):
+        """
+        Argumentos:
+        C: Constante da EDO (diferente de zero)
+        c1, c2: Constantes de integração
+        """
+        self.C = np.asarray(C, dtype=float)
+        self.c1 = np.asarray(c1, dtype=float)
+        self.c2 = np.asarray(c2, dtype=float)
+        if np.any(self.C == 0):
+            raise ValueError("C deve ser diferente de zero (com C = 0 a solução é a reta entre os contornos)")
+
+    @classmethod
+    def do_contorno(cls, C, a, b, y0, yb) -> "SolucaoAnaliticaCabo":
+        """
+        Constantes a partir de y(a) = y0 e y(b) = yb.
+
+        Como cosh(u) - cosh(v) = 2 sinh((u + v)/2) sinh((u - v)/2), a condição
+        cosh(C b + c1) - cosh(C a + c1) = C (yb - y0) dá c1 diretamente:
+        c1 = asinh(C (yb - y0) / (2 sinh(C (b - a) / 2))) - C (a + b) / 2
+        """
+        C, a, b, y0, yb = (np.asarray(v, dtype=float) for v in (C, a, b, y0, yb))
+        c1 = np.arcsinh(C * (yb - y0) / (2 * np.sinh(C * (b - a) / 2))) - C * (a + b) / 2
+        c2 = y0 - np.cosh(C * a + c1) / C
+        return cls(C, c1, c2)
+
+    @classmethod
+    def do_valor_inicial(cls, C, a, y0, dy0) -> "SolucaoAnaliticaCabo":
+        """Constantes a partir de y(a) = y0 e y'(a) = dy0 (PVI)"""
+        C, a, y0, dy0 = (np.asarray(v, dtype=float) for v in (C, a, y0, dy0))
+        c1 = np.arcsinh(dy0) - C * a
+        c2 = y0 - np.cosh(C * a + c1) / C
+        return cls(C, c1, c2)
+
+    @classmethod
+    def do_problema(cls, problema: Optional[ProblemaCabo] = None) -> "SolucaoAnaliticaCabo":
+        """Solução exata do PVC descrito por ProblemaCabo (padrão: o do enunciado)"""
+        p = problema if problema is not None else ProblemaCabo()
+        return cls.do_contorno(p.C, p.a, p.b, p.y0, p.yb)
+
+    def y(self, x) -> np.ndarray:
+        """y(x) = cosh(C x + c1) / C + c2"""
+        return np.cosh(self.C * np.asarray(x) + self.c1) / self.C + self.c2
+
+    def dy(self, x) -> np.ndarray:
+        """y'(x) = sinh(C x + c1)"""
+        return np.sinh(self.C * np.asarray(x) + self.c1)
+
+    def d2y(self, x) -> np.ndarray:
+        """y''(x) = C cosh(C x + c1)"""
+        return self.C * np.cosh(self.C * np.asarray(x) + self.c1)
+
+    def __call__(self, x) -> np.ndarray:
+        """Estado [y, y'] em x, no mesmo formato da matriz X retornada por SolverEDO.rk4 e SolverEDO.tiro"""
+        u = self.C * np.asarray(x) + self.c1
+        return np.stack([np.cosh(u) / self.C + self.c2, np.sinh(u)])
+
+
+if __name__ == "__main__":
+    from solvers_edo import SolverEDO
+
+    p = ProblemaCabo()
+    exata = SolucaoAnaliticaCabo.do_problema(p)
+    print(f"c1 = {float(exata.c1):.10f}, c2 = {float(exata.c2):.10f}")
+    print(f"y'(a) = {float(exata.dy(p.a)):.10f}, y(b) = {float(exata.y(p.b)):.10f}")
+
+    T, X = SolverEDO.tiro(p.f, p.a, p.b, p.h, p.y0, p.yb, p.chute1, p.chute2, tol=p.tol, max_iter=p.max_iter)
+    erro = np.abs(X - exata(T)).max(axis=1)
+    print(f"Erro máximo do Tiro (h = {p.h}): y = {erro[0]:.2e}, y' = {erro[1]:.2e}")
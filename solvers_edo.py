@@ -1,11 +1,64 @@
 import numpy as np
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
+
+from interpolacao import hermite_cubico
+
+# Tabela de Butcher do método de Dormand-Prince 5(4) (usado em SolverEDO.dopri54)
+_DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1])
+_DP_A = [
+    np.array([]),
+    np.array([1/5]),
+    np.array([3/40, 9/40]),
+    np.array([44/45, -56/15, 32/9]),
+    np.array([19372/6561, -25360/2187, 64448/6561, -212/729]),
+    np.array([9017/3168, -355/33, 46732/5247, 49/176, -5103/18656]),
+]
+_DP_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84])
+
+# Diferença entre os pesos de 5ª e 4ª ordem (o 7º estágio é o f do novo ponto, FSAL)
+_DP_E = np.array([-71/57600, 0, 71/16695, -71/1920, 17253/339200, -22/525, 1/40])
+
+# Coeficientes da saída densa de 4ª ordem: x(t + θh) = x + h * K @ (_DP_P @ [θ, θ², θ³, θ⁴])
+_DP_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+# TR-BDF2: estágio trapezoidal até t + γh e BDF2 até t + h. Com γ = 2 - √2 os dois estágios têm a
+# mesma matriz de iteração I - (γ/2) h J, fatorada uma vez para ambos
+_TRBDF2_GAMA = 2 - np.sqrt(2)
+
+# ROS2 (Verwer et al., 1999): Rosenbrock de 2ª ordem e L-estável; como método W, mantém a ordem
+# com uma jacobiana aproximada ou desatualizada
+_ROS2_GAMA = 1 + 1 / np.sqrt(2)
+
+# Métodos implícitos -> fator c da matriz de iteração I - c h J (usados em SolverEDO.integrar)
+_IMPLICITOS = {'euler_implicito': 1.0, 'trbdf2': _TRBDF2_GAMA / 2, 'rosenbrock': _ROS2_GAMA}
 
 class SolverEDO:
     """
     Uma classe que agrupa métodos estaticos para resolver sistemas de EDOs.
     """
 
+    @staticmethod
+    def malha(a: float, b: float, h: float) -> Tuple[np.ndarray, float]:
+        """
+        Malha uniforme de a até b com passo o mais próximo possível de h
+
+        O número de passos é round((b - a) / h) e o passo é ajustado para que o último ponto seja
+        exatamente b (np.arange(a, b + h, h) pode incluir um ponto além de b por arredondamento).
+
+        Retorna:
+        (np.ndarray, float): Vetor T e o passo efetivo
+        """
+        n_passos = max(1, int(round((b - a) / h)))
+        return np.linspace(a, b, n_passos + 1), (b - a) / n_passos
+
     @staticmethod
     def rk1(f: Callable, a: float, b: float, h: float, x0) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -15,31 +68,31 @@ class SolverEDO:
         f (Callable): Função que calcula as derivadas (deve receber t e x)
         a (float): Início do intervalo
         b (float): Fim do intervalo
-        h (float): Tamanho do passo
-        x0 (np.ndarray): Condições iniciais (vetor)
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
+        x0 (np.ndarray): Condições iniciais (vetor (m,) ou lote (m, k) com k estados iniciais)
 
         Retorna:
-        (np.ndarray, np.ndarray): Tupla com o vetor T e a matriz solução X
+        (np.ndarray, np.ndarray): Tupla com o vetor T e a matriz solução X ((m, n) ou (m, k, n) em lote)
         """
         # Força np.ndarray
         x0 = np.asarray(x0)
 
         # Cria o array com t0 ate tb com passo h
-        T = np.arange(a, b + h, h)
+        T, h = SolverEDO.malha(a, b, h)
         n = len(T)
-        m = len(x0)
 
         # Cria um array com as aproximações no tempo (todas = 0)
-        X = np.zeros((m, n))
+        # Em lote (x0 com forma (m, k)), X fica (m, k, n)
+        X = np.zeros(x0.shape + (n,))
 
         # Primeira coluna inicia com os valores inicias passados como parametro 
-        X[:, 0] = x0
+        X[..., 0] = x0
 
         # Itera aplicando Euler "n" vezes
         for i in range(n - 1):
             t_i = T[i]                          # Pega o valor atual do tempo (qual iteração)
-            x_i = X[:, i]                       # Pega os valores da ultima interação
-            X[:, i + 1] = x_i + h * f(t_i, x_i) # Aplica Euler para chutar proximos valores
+            x_i = X[..., i]                     # Pega os valores da ultima interação
+            X[..., i + 1] = x_i + h * f(t_i, x_i) # Aplica Euler para chutar proximos valores
 
         return T, X
 
@@ -52,130 +105,1024 @@ class SolverEDO:
         f (Callable): Função que calcula as derivadas (deve receber t e x)
         a (float): Início do intervalo
         b (float): Fim do intervalo
-        h (float): Tamanho do passo
-        x0 (np.ndarray): Condições iniciais (vetor)
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
+        x0 (np.ndarray): Condições iniciais (vetor (m,) ou lote (m, k) com k estados iniciais)
 
         Retorna:
-        (np.ndarray, np.ndarray): Tupla com o vetor T e a matriz solução X
+        (np.ndarray, np.ndarray): Tupla com o vetor T e a matriz solução X ((m, n) ou (m, k, n) em lote)
         """
         # Força np.ndarray
         x0 = np.asarray(x0)
 
         # Cria o array com t0 até tb com passo h
-        T = np.arange(a, b + h, h)
+        T, h = SolverEDO.malha(a, b, h)
         n = len(T)
-        m = len(x0)
 
         # Cria um array com as aproximações no tempo (todas = 0)
-        X = np.zeros((m, n))
+        # Em lote (x0 com forma (m, k)), X fica (m, k, n)
+        X = np.zeros(x0.shape + (n,))
 
         # Primeira coluna inicia com os valores iniciais passados como parametro
-        X[:, 0] = x0
+        X[..., 0] = x0
 
         # Itera aplicando RK2 "n" vezes
         for i in range(n - 1):
             t_i = T[i]                     # Tempo atual
-            x_i = X[:, i]                  # Estado atual (todas variáveis)
+            x_i = X[..., i]                # Estado atual (todas variáveis)
 
             k1 = f(t_i, x_i)               # Estima a derivada em t_i
             k2 = f(t_i + h, x_i + h * k1)  # Estima a derivada em t_i + h (usando k1)
 
             # Atualiza o próximo valor com a média ponderada das inclinações (formula de rk2)
-            X[:, i + 1] = x_i + (h / 2) * (k1 + k2)
+            X[..., i + 1] = x_i + (h / 2) * (k1 + k2)
 
         return T, X
 
     @staticmethod
-    def rk4(f: Callable, a: float, b: float, h: float, x0) -> Tuple[np.ndarray, np.ndarray]:
+    def rk4(f: Callable, a: float, b: float, h: float, x0, inplace: bool = False, salvar_cada: int = 1,
+            t_saida=None, arquivo_memmap: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Resolve um sistema de EDOs usando o método de Runge-Kutta de 4ª ordem
 
         Argumentos:
-        f (Callable): Função que calcula as derivadas (deve receber t e x)
+        f (Callable): Função que calcula as derivadas (deve receber t e x; com inplace, t, x e out)
         a (float): Início do intervalo
         b (float): Fim do intervalo
-        h (float): Tamanho do passo
-        x0 (np.ndarray): Condições iniciais (vetor)
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
+        x0 (np.ndarray): Condições iniciais (vetor (m,) ou lote (m, k) com k estados iniciais)
+        inplace (bool): Se True, f tem a forma f(t, x, out) e escreve as derivadas em out; os
+                        estágios usam buffers pré-alocados e o laço não aloca arrays a cada passo
+        salvar_cada (int): Guarda apenas um a cada salvar_cada passos (o último ponto é sempre guardado)
+        t_saida (np.ndarray): Pontos de saída crescentes em [a, T[-1]]; o estado é interpolado por Hermite
+                              cúbico entre os passos da malha e T retornado é t_saida (ignora salvar_cada)
+        arquivo_memmap (str): Se fornecido, X é gravado direto em um arquivo .npy mapeado em memória
+                              (np.lib.format.open_memmap), reabrível com np.load(..., mmap_mode='r')
 
         Retorna:
-        (np.ndarray, np.ndarray): Tupla com o vetor T e a matriz solução X
+        (np.ndarray, np.ndarray): Tupla com o vetor T e a matriz solução X ((m, n) ou (m, k, n) em lote)
         """
         # Força np.ndarray
         x0 = np.asarray(x0)
 
         # Cria o array com t0 até tb com passo h
-        T = np.arange(a, b + h, h)
+        T, h = SolverEDO.malha(a, b, h)
         n = len(T)
-        m = len(x0)
 
-        # Cria um array com as aproximações no tempo (todas = 0)
-        X = np.zeros((m, n))
+        if salvar_cada < 1:
+            raise ValueError("salvar_cada deve ser >= 1")
+
+        if t_saida is not None:
+            t_saida = np.asarray(t_saida, dtype=float)
+            if t_saida.ndim != 1 or len(t_saida) == 0:
+                raise ValueError("t_saida deve ser um vetor com pelo menos um ponto")
+            if np.any(np.diff(t_saida) < 0) or t_saida[0] < T[0] or t_saida[-1] > T[-1]:
+                raise ValueError(f"t_saida deve ser crescente e estar em [{T[0]}, {T[-1]}]")
+            n_saida = len(t_saida)
+        elif salvar_cada > 1:
+            indices = np.arange(0, n, salvar_cada)
+            if indices[-1] != n - 1:
+                indices = np.append(indices, n - 1)
+            n_saida = len(indices)
+        else:
+            n_saida = n
+
+        # Cria um array com as aproximações no tempo (todas = 0), em memória ou em arquivo
+        # Em lote, x0 tem forma (m, k) e X fica (m, k, n): f é chamada uma vez por estágio para todo o lote
+        if arquivo_memmap is None:
+            X = np.zeros(x0.shape + (n_saida,))
+        else:
+            X = np.lib.format.open_memmap(arquivo_memmap, mode='w+', dtype=float, shape=x0.shape + (n_saida,))
+
+        if t_saida is not None:
+            SolverEDO._rk4_interpolado(f, T, h, x0, inplace, t_saida, X)
+            return t_saida, SolverEDO._finalizar_memmap(X)
+
+        if salvar_cada > 1:
+            SolverEDO._rk4_decimado(f, T, h, x0, inplace, indices, X)
+            return T[indices], SolverEDO._finalizar_memmap(X)
 
         # Primeira coluna inicia com os valores iniciais passados como parametro
-        X[:, 0] = x0
+        X[..., 0] = x0
 
         # Itera aplicando RK4 "n" vezes
+        if inplace:
+            buffers = SolverEDO._buffers_rk4(x0.shape)
+            for i in range(n - 1):
+                SolverEDO._passo_rk4_inplace(f, T[i], X[..., i], h, X[..., i + 1], buffers)
+        else:
+            for i in range(n - 1):
+                X[..., i + 1] = SolverEDO._passo_rk4(f, T[i], X[..., i], h)
+
+        return T, SolverEDO._finalizar_memmap(X)
+
+    @staticmethod
+    def _finalizar_memmap(X: np.ndarray) -> np.ndarray:
+        """Descarrega X no disco quando é um np.memmap (no-op para arrays em memória)"""
+        if isinstance(X, np.memmap):
+            X.flush()
+        return X
+
+    @staticmethod
+    def _rk4_decimado(f: Callable, T: np.ndarray, h: float, x0: np.ndarray, inplace: bool,
+                      indices: np.ndarray, X: np.ndarray) -> None:
+        """Integra com RK4 guardando em X apenas os passos listados em indices (crescentes, terminando em n - 1)"""
+        x = np.array(x0, dtype=float)
+        proximo = np.empty_like(x)
+        buffers = SolverEDO._buffers_rk4(x.shape) if inplace else None
+        j = 0
+
+        for i in range(len(T)):
+            if i == indices[j]:
+                X[..., j] = x
+                j += 1
+                if j == len(indices):
+                    break
+            if inplace:
+                SolverEDO._passo_rk4_inplace(f, T[i], x, h, proximo, buffers)
+            else:
+                proximo = SolverEDO._passo_rk4(f, T[i], x, h)
+            x, proximo = proximo, x
+
+    @staticmethod
+    def _rk4_interpolado(f: Callable, T: np.ndarray, h: float, x0: np.ndarray, inplace: bool,
+                         t_saida: np.ndarray, X: np.ndarray) -> None:
+        """Integra com RK4 e preenche X nos pontos t_saida por Hermite cúbico entre passos consecutivos"""
+        def derivada(t, x):
+            if not inplace:
+                return np.asarray(f(t, x))
+            out = np.empty_like(x)
+            f(t, x, out)
+            return out
+
+        x = np.array(x0, dtype=float)
+        proximo = np.empty_like(x)
+        buffers = SolverEDO._buffers_rk4(x.shape) if inplace else None
+        j, m = 0, len(t_saida)
+
+        for i in range(len(T) - 1):
+            if j == m:
+                break
+            if inplace:
+                SolverEDO._passo_rk4_inplace(f, T[i], x, h, proximo, buffers)
+            else:
+                proximo = SolverEDO._passo_rk4(f, T[i], x, h)
+
+            # Pontos de saída em [T[i], T[i+1]]: as derivadas extras só são avaliadas nesses passos
+            fim = j + np.searchsorted(t_saida[j:], T[i + 1], side='right')
+            if fim > j:
+                x0, d0, x1, d1 = (v[..., np.newaxis] for v in (x, derivada(T[i], x), proximo, derivada(T[i + 1], proximo)))
+                X[..., j:fim] = hermite_cubico(T[i], x0, d0, T[i + 1], x1, d1, t_saida[j:fim])
+                j = fim
+            x, proximo = proximo, x
+
+    @staticmethod
+    def rk4_final(f: Callable, a: float, b: float, h: float, x0, inplace: bool = False) -> np.ndarray:
+        """
+        Integra como SolverEDO.rk4, mas guarda apenas o estado atual e retorna o estado final
+
+        Usa a mesma malha de rk4 (o resultado é idêntico a X[..., -1]), sem alocar a matriz (m, n).
+
+        Argumentos:
+        f (Callable): Função que calcula as derivadas (deve receber t e x)
+        a (float): Início do intervalo
+        b (float): Fim do intervalo
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
+        x0 (np.ndarray): Condições iniciais (vetor (m,) ou lote (m, k) com k estados iniciais)
+        inplace (bool): Se True, f tem a forma f(t, x, out) (ver SolverEDO.rk4)
+
+        Retorna:
+        np.ndarray: Estado no último ponto da malha
+        """
+        x = np.array(x0, dtype=float)
+        T, h = SolverEDO.malha(a, b, h)
+
+        if inplace:
+            # O estado alterna entre dois arrays: nenhum array novo é criado no laço
+            buffers = SolverEDO._buffers_rk4(x.shape)
+            proximo = np.empty_like(x)
+            for t_i in T[:-1]:
+                SolverEDO._passo_rk4_inplace(f, t_i, x, h, proximo, buffers)
+                x, proximo = proximo, x
+            return x
+
+        for t_i in T[:-1]:
+            x = SolverEDO._passo_rk4(f, t_i, x, h)
+
+        return x
+
+    @staticmethod
+    def _passo_rk4(f: Callable, t_i: float, x_i: np.ndarray, h: float) -> np.ndarray:
+        """Aplica um passo de RK4 a partir de (t_i, x_i) e retorna o estado em t_i + h"""
+        k1 = f(t_i, x_i)                              # Estima a derivada no ponto inicial (t_i)
+        k2 = f(t_i + (h / 2), x_i + (h / 2) * k1)         # Estima a derivada no ponto "medio" (t_i + h/2)
+        k3 = f(t_i + (h / 2), x_i + (h / 2) * k2)         # Estima a derivada no ponto "medio"
+        k4 = f(t_i + h, x_i + h * k3)                 # Estima a derivada no final do intervalo (t_i + h)
+
+        # Média ponderada das inclinações (fórmula de RK4)
+        return x_i + (h / 6) * (k1 + 2*k2 + 2*k3 + k4) # Equivalente: x_i + h*((k1/6) + (k2/3) + (k3/3) + (k4/6))
+
+    @staticmethod
+    def _buffers_rk4(forma: Tuple[int, ...]) -> Tuple[np.ndarray, ...]:
+        """Aloca os buffers k1, k2, k3, k4 e o estado intermediário usados por _passo_rk4_inplace"""
+        return tuple(np.empty(forma) for _ in range(5))
+
+    @staticmethod
+    def _passo_rk4_inplace(f: Callable, t_i: float, x_i: np.ndarray, h: float, out: np.ndarray,
+                           buffers: Tuple[np.ndarray, ...]) -> None:
+        """Passo de RK4 como _passo_rk4, com f(t, x, out) e escrevendo o novo estado em out (sem alocar)"""
+        k1, k2, k3, k4, x_tmp = buffers
+
+        f(t_i, x_i, k1)                                   # Derivada no ponto inicial (t_i)
+        np.multiply(k1, h / 2, out=x_tmp)
+        x_tmp += x_i
+        f(t_i + (h / 2), x_tmp, k2)                       # Derivada no ponto "medio" (t_i + h/2)
+        np.multiply(k2, h / 2, out=x_tmp)
+        x_tmp += x_i
+        f(t_i + (h / 2), x_tmp, k3)                       # Derivada no ponto "medio"
+        np.multiply(k3, h, out=x_tmp)
+        x_tmp += x_i
+        f(t_i + h, x_tmp, k4)                             # Derivada no final do intervalo (t_i + h)
+
+        # out = x_i + (h / 6) * (k1 + 2*k2 + 2*k3 + k4), acumulando em k2
+        k2 += k3
+        k2 *= 2
+        k2 += k1
+        k2 += k4
+        k2 *= h / 6
+        np.add(x_i, k2, out=out)
+
+    @staticmethod
+    def dopri54(f: Callable, a: float, b: float, x0, rtol: float = 1e-6, atol: float = 1e-9,
+                h0: Optional[float] = None, t_eval=None, max_passos: int = 100000) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve um sistema de EDOs com o método adaptativo de Dormand-Prince 5(4)
+
+        O passo é controlado pela estimativa de erro do par embutido (ordens 5 e 4): passos com erro
+        acima da tolerância são rejeitados e refeitos com h menor. Com t_eval, a solução é avaliada
+        nesses pontos pela saída densa de 4ª ordem, sem forçar o integrador a passar por eles.
+
+        Argumentos:
+        f (Callable): Função que calcula as derivadas (deve receber t e x)
+        a (float): Início do intervalo
+        b (float): Fim do intervalo
+        x0 (np.ndarray): Condições iniciais (vetor (m,) ou lote (m, k) com k estados iniciais)
+        rtol (float): Tolerância relativa do erro local
+        atol (float): Tolerância absoluta do erro local
+        h0 (float): Passo inicial (estimado automaticamente se None)
+        t_eval (np.ndarray): Pontos em [a, b] onde a solução deve ser retornada (se None, os passos aceitos)
+        max_passos (int): Número máximo de passos (aceitos + rejeitados)
+
+        Retorna:
+        (np.ndarray, np.ndarray): Tupla com o vetor T e a matriz solução X ((m, n) ou (m, k, n) em lote)
+        """
+        # Força np.ndarray
+        x = np.asarray(x0, dtype=float)
+        t = float(a)
+        fx = np.asarray(f(t, x))
+
+        def norma(v, escala):
+            # Norma RMS ponderada pelas tolerâncias
+            return np.sqrt(np.mean((v / escala) ** 2))
+
+        # Passo inicial (Hairer, Nørsett e Wanner): h tal que o termo de 1ª ordem fique na tolerância
+        if h0 is None:
+            escala = atol + np.abs(x) * rtol
+            d0, d1 = norma(x, escala), norma(fx, escala)
+            h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+            f1 = np.asarray(f(t + h0, x + h0 * fx))
+            d2 = norma(f1 - fx, escala) / h0
+            h1 = max(1e-6, h0 * 1e-3) if max(d1, d2) <= 1e-15 else (0.01 / max(d1, d2)) ** (1 / 5)
+            h0 = min(100 * h0, h1)
+        h = min(h0, b - a)
+
+        if t_eval is not None:
+            t_eval = np.asarray(t_eval, dtype=float)
+            if t_eval.ndim != 1 or len(t_eval) == 0:
+                raise ValueError("t_eval deve ser um vetor com pelo menos um ponto")
+            if np.any(np.diff(t_eval) < 0) or t_eval[0] < a or t_eval[-1] > b:
+                raise ValueError(f"t_eval deve ser crescente e estar em [{a}, {b}]")
+            X = np.zeros(x.shape + (len(t_eval),))
+            j = 0                                   # Próximo ponto de t_eval a preencher
+            while j < len(t_eval) and t_eval[j] <= t:
+                X[..., j] = x
+                j += 1
+        else:
+            T_lista, X_lista = [t], [x]
+
+        K = np.zeros((7,) + x.shape)
+        for _ in range(max_passos):
+            if t >= b:
+                break
+            h = min(h, b - t)
+
+            # Estágios do método (o primeiro é o f já conhecido do ponto atual)
+            K[0] = fx
+            for s in range(1, 6):
+                K[s] = f(t + _DP_C[s] * h, x + h * np.tensordot(_DP_A[s], K[:s], axes=1))
+            x_novo = x + h * np.tensordot(_DP_B, K[:6], axes=1)
+            K[6] = f(t + h, x_novo)
+
+            # Erro local estimado pela diferença entre as soluções de 5ª e 4ª ordem
+            escala = atol + np.maximum(np.abs(x), np.abs(x_novo)) * rtol
+            erro = norma(h * np.tensordot(_DP_E, K, axes=1), escala)
+
+            if not np.isfinite(erro):
+                # Estágio com inf/NaN: rejeita o passo com a maior redução permitida
+                h *= 0.2
+                if t + h == t:
+                    raise RuntimeError(f"dopri54: f retornou valores não finitos em t = {t}")
+                continue
+
+            if erro > 1:
+                # Passo rejeitado: reduz h e tenta de novo a partir do mesmo ponto
+                h *= max(0.2, 0.9 * erro ** (-1 / 5))
+                continue
+
+            if t_eval is not None:
+                # Saída densa para os pontos de t_eval dentro do passo aceito
+                Q = np.tensordot(_DP_P.T, K, axes=([1], [0]))
+                while j < len(t_eval) and t_eval[j] <= t + h:
+                    theta = (t_eval[j] - t) / h
+                    potencias = theta ** np.arange(1, 5)
+                    X[..., j] = x + h * np.tensordot(potencias, Q, axes=1)
+                    j += 1
+
+            t = t + h
+            x, fx = x_novo, K[6].copy()
+            if t_eval is None:
+                T_lista.append(t)
+                X_lista.append(x)
+
+            # Próximo passo proporcional a erro^(-1/5), limitado a [0.2h, 10h]
+            h *= min(10.0, max(0.2, 0.9 * erro ** (-1 / 5))) if erro > 0 else 10.0
+        else:
+            raise RuntimeError(f"dopri54 excedeu {max_passos} passos antes de chegar a b = {b}")
+
+        if t_eval is not None:
+            return t_eval, X
+        return np.array(T_lista), np.stack(X_lista, axis=-1)
+
+    @staticmethod
+    def euler_implicito(f: Callable, a: float, b: float, h: float, x0, jac: Optional[Callable] = None,
+                        tol: float = 1e-10, max_iter: int = 10, passos_jac: int = 20,
+                        info: Optional[dict] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve um sistema de EDOs com o método de Euler implícito: x+ = x + h f(t + h, x+)
+
+        A equação de cada passo é resolvida por Newton simplificado: a matriz de iteração
+        I - h J é invertida uma vez e reaproveitada nas iterações e nos passos seguintes, sendo
+        recalculada a cada passos_jac passos ou quando o Newton não converge. O método é L-estável:
+        componentes rígidas (autovalores de J muito negativos) não limitam o passo.
+
+        Argumentos:
+        f (Callable): Função que calcula as derivadas (deve receber t e x)
+        a (float): Início do intervalo
+        b (float): Fim do intervalo
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
+        x0 (np.ndarray): Condições iniciais (vetor (m,) ou lote (m, k) com k estados iniciais)
+        jac (Callable): Jacobiana df/dx (recebe t e x, retorna (m, m), ou (m, m, k) em lote); se None,
+                        é aproximada por diferenças progressivas, coluna a coluna
+        tol (float): Tolerância (relativa a 1 + max|x|) para a correção de Newton
+        max_iter (int): Número máximo de iterações de Newton por passo
+        passos_jac (int): Passos entre recálculos da jacobiana e da matriz de iteração
+        info (dict): Se fornecido, recebe 'passos', 'fatoracoes' e 'iteracoes_newton'
+
+        Retorna:
+        (np.ndarray, np.ndarray): Tupla com o vetor T e a matriz solução X ((m, n) ou (m, k, n) em lote)
+        """
+        return SolverEDO._integrar_implicito('euler_implicito', f, a, b, h, x0, jac, tol, max_iter, passos_jac, info)
+
+    @staticmethod
+    def trbdf2(f: Callable, a: float, b: float, h: float, x0, jac: Optional[Callable] = None,
+               tol: float = 1e-10, max_iter: int = 10, passos_jac: int = 20,
+               info: Optional[dict] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve um sistema de EDOs com o método TR-BDF2 (2ª ordem, L-estável)
+
+        Cada passo faz um estágio da regra do trapézio até t + γh e um BDF2 até t + h, com
+        γ = 2 - √2 para que os dois estágios usem a mesma matriz de iteração. Argumentos e
+        retorno como em SolverEDO.euler_implicito.
+        """
+        return SolverEDO._integrar_implicito('trbdf2', f, a, b, h, x0, jac, tol, max_iter, passos_jac, info)
+
+    @staticmethod
+    def rosenbrock(f: Callable, a: float, b: float, h: float, x0, jac: Optional[Callable] = None,
+                   passos_jac: int = 20, info: Optional[dict] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve um sistema de EDOs com o método de Rosenbrock ROS2 (2ª ordem, L-estável)
+
+        Linearmente implícito: cada passo resolve dois sistemas lineares com a matriz I - γhJ, sem
+        iterações de Newton. Por ser um método W, a ordem não depende de J ser exata, então a
+        matriz pode ser reaproveitada por passos_jac passos. Argumentos e retorno como em
+        SolverEDO.euler_implicito.
+        """
+        return SolverEDO._integrar_implicito('rosenbrock', f, a, b, h, x0, jac, passos_jac=passos_jac, info=info)
+
+    @staticmethod
+    def integrar(f: Callable, a: float, b: float, h: float, x0, metodo: str = 'rk4', jac: Optional[Callable] = None,
+                 apenas_final: bool = False, info: Optional[dict] = None, **opcoes):
+        """
+        Integra com o método escolhido pelo nome (usado pelo Tiro e pela varredura)
+
+        Argumentos:
+        f, a, b, h, x0: Como em SolverEDO.rk4
+        metodo (str): 'rk4' ou um dos implícitos: 'euler_implicito', 'trbdf2', 'rosenbrock'
+        jac (Callable): Jacobiana df/dx para os métodos implícitos (ignorada pelo rk4)
+        apenas_final (bool): Se True, retorna apenas o estado em b (como SolverEDO.rk4_final)
+        info (dict): Se fornecido, recebe 'passos' e as contagens do método: 'avaliacoes_f' no rk4,
+                     'fatoracoes' e 'iteracoes_newton' nos implícitos
+        opcoes: Demais argumentos do método (inplace do rk4; tol, max_iter e passos_jac dos implícitos)
+
+        Retorna:
+        (np.ndarray, np.ndarray) ou np.ndarray: T e X, ou apenas o estado final com apenas_final
+        """
+        if metodo == 'rk4':
+            if info is not None:
+                n_passos = len(SolverEDO.malha(a, b, h)[0]) - 1
+                info.update(passos=n_passos, avaliacoes_f=4 * n_passos)
+            if apenas_final:
+                return SolverEDO.rk4_final(f, a, b, h, x0, **opcoes)
+            return SolverEDO.rk4(f, a, b, h, x0, **opcoes)
+        if metodo not in _IMPLICITOS:
+            raise ValueError(f"Método desconhecido: {metodo!r} (use 'rk4', {', '.join(map(repr, _IMPLICITOS))})")
+        return SolverEDO._integrar_implicito(metodo, f, a, b, h, x0, jac, info=info, apenas_final=apenas_final, **opcoes)
+
+    @staticmethod
+    def _integrar_implicito(metodo: str, f: Callable, a: float, b: float, h: float, x0, jac: Optional[Callable] = None,
+                            tol: float = 1e-10, max_iter: int = 10, passos_jac: int = 20,
+                            info: Optional[dict] = None, apenas_final: bool = False):
+        """
+        Laço comum dos métodos implícitos: malha, reaproveitamento da matriz de iteração e saída.
+
+        A "fatoração" de I - c h J é a sua inversa (numpy não separa fatoração e solução do LU), que
+        transforma cada sistema linear dos passos em um produto matriz-vetor.
+        """
+        x = np.asarray(x0, dtype=float)
+        T, h = SolverEDO.malha(a, b, h)
+        n = len(T)
+        passo = getattr(SolverEDO, f"_passo_{metodo}")
+        c = _IMPLICITOS[metodo]
+
+        if not apenas_final:
+            X = np.zeros(x.shape + (n,))
+            X[..., 0] = x
+
+        contagem = {'passos': n - 1, 'fatoracoes': 0, 'iteracoes_newton': 0}
+
+        def fatorar(t, x):
+            contagem['fatoracoes'] += 1
+            J = SolverEDO._jacobiana(f, jac, t, x)
+            return np.linalg.inv(np.eye(x.shape[0]) - c * h * J)
+
+        M, idade = None, 0
         for i in range(n - 1):
-            t_i = T[i]                     # Tempo atual
-            x_i = X[:, i]                  # Estado atual (todas variáveis)
+            if M is None or idade >= passos_jac:
+                M, idade = fatorar(T[i], x), 0
 
-            k1 = f(t_i, x_i)                              # Estima a derivada no ponto inicial (t_i)
-            k2 = f(t_i + (h / 2), x_i + (h / 2) * k1)         # Estima a derivada no ponto "medio" (t_i + h/2)
-            k3 = f(t_i + (h / 2), x_i + (h / 2) * k2)         # Estima a derivada no ponto "medio"
-            k4 = f(t_i + h, x_i + h * k3)                 # Estima a derivada no final do intervalo (t_i + h)
+            x_novo = passo(f, T[i], x, h, M, tol, max_iter, contagem)
+            if x_novo is None and idade > 0:
+                # Newton não convergiu com a matriz antiga: recalcula no ponto atual e refaz o passo
+                M, idade = fatorar(T[i], x), 0
+                x_novo = passo(f, T[i], x, h, M, tol, max_iter, contagem)
+            if x_novo is None:
+                raise RuntimeError(f"{metodo}: Newton não convergiu em t = {T[i]:.6g} (reduza h)")
 
-            # Atualiza o próximo valor com a média ponderada das inclinações (fórmula de RK4)
-            X[:, i + 1] = x_i + (h / 6) * (k1 + 2*k2 + 2*k3 + k4) # Equivalente: x_i + h*((k1/6) + (k2/3) + (k3/3) + (k4/6))
+            x = x_novo
+            idade += 1
+            if not apenas_final:
+                X[..., i + 1] = x
 
-        return T, X
+        if info is not None:
+            info.update(contagem)
+
+        return x if apenas_final else (T, X)
 
     @staticmethod
-    def tiro(f: Callable, a: float, b: float, h: float, y0: float, yb: float, chute1: float, chute2: float, tol: float = 1e-5, max_iter: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    def _jacobiana(f: Callable, jac: Optional[Callable], t: float, x: np.ndarray) -> np.ndarray:
+        """
+        J = df/dx com forma (m, m), ou (k, m, m) para um lote x (m, k).
+
+        Sem jac, cada coluna j vem de uma diferença progressiva em x_j (todo o lote de uma vez).
+        """
+        if jac is not None:
+            J = np.asarray(jac(t, x), dtype=float)
+        else:
+            f0 = np.asarray(f(t, x), dtype=float)
+            J = np.empty((x.shape[0],) + x.shape)
+            for j in range(x.shape[0]):
+                eps = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x[j]))
+                x_eps = x.copy()
+                x_eps[j] += eps
+                J[:, j] = (np.asarray(f(t, x_eps)) - f0) / eps
+
+        # (m, m, k) -> (k, m, m): uma matriz por estado do lote, como espera np.linalg.inv
+        return np.moveaxis(J, (0, 1), (-2, -1))
+
+    @staticmethod
+    def _aplicar(M: np.ndarray, r: np.ndarray) -> np.ndarray:
+        """M r para M (m, m) ou (k, m, m) e r (m,) ou (m, k)"""
+        return np.einsum('...ij,j...->i...', M, r)
+
+    @staticmethod
+    def _newton_implicito(f: Callable, t: float, v: np.ndarray, ch: float, x: np.ndarray, M: np.ndarray,
+                          tol: float, max_iter: int, contagem: dict) -> Optional[np.ndarray]:
+        """
+        Resolve x = v + ch f(t, x) por Newton simplificado com M ≈ (I - ch J)^-1 fixa.
+
+        Retorna None se não convergir em max_iter iterações.
+        """
+        for _ in range(max_iter):
+            contagem['iteracoes_newton'] += 1
+            dx = SolverEDO._aplicar(M, x - v - ch * np.asarray(f(t, x)))
+            x = x - dx
+            if not np.all(np.isfinite(x)):
+                return None
+            if np.max(np.abs(dx)) <= tol * (1.0 + np.max(np.abs(x))):
+                return x
+        return None
+
+    @staticmethod
+    def _passo_euler_implicito(f: Callable, t: float, x: np.ndarray, h: float, M: np.ndarray,
+                               tol: float, max_iter: int, contagem: dict) -> Optional[np.ndarray]:
+        """Um passo de Euler implícito: x+ = x + h f(t + h, x+)"""
+        return SolverEDO._newton_implicito(f, t + h, x, h, x, M, tol, max_iter, contagem)
+
+    @staticmethod
+    def _passo_trbdf2(f: Callable, t: float, x: np.ndarray, h: float, M: np.ndarray,
+                      tol: float, max_iter: int, contagem: dict) -> Optional[np.ndarray]:
+        """Um passo do TR-BDF2 (trapézio até t + γh, BDF2 até t + h), ambos com M = (I - (γ/2) h J)^-1"""
+        g = _TRBDF2_GAMA
+        d = g / 2 * h
+
+        # Trapézio: x_g = x + (γh/2) (f(t, x) + f(t + γh, x_g))
+        x_g = SolverEDO._newton_implicito(f, t + g * h, x + d * np.asarray(f(t, x)), d, x, M, tol, max_iter, contagem)
+        if x_g is None:
+            return None
+
+        # BDF2 com os pontos t, t + γh e t + h
+        v = (x_g - (1 - g)**2 * x) / (g * (2 - g))
+        return SolverEDO._newton_implicito(f, t + h, v, d, x_g, M, tol, max_iter, contagem)
+
+    @staticmethod
+    def _passo_rosenbrock(f: Callable, t: float, x: np.ndarray, h: float, M: np.ndarray,
+                          tol: float, max_iter: int, contagem: dict) -> np.ndarray:
+        """
+        Um passo do ROS2 com M = (I - γhJ)^-1 (tol e max_iter não são usados: não há Newton).
+
+        O termo γh df/dt (diferença progressiva em t, calculada a cada passo) mantém a precisão em
+        problemas não autônomos rígidos; em problemas autônomos ele é nulo.
+        """
+        fx = np.asarray(f(t, x))
+        dt = np.sqrt(np.finfo(float).eps) * max(1.0, abs(t))
+        gh_ft = _ROS2_GAMA * h * (np.asarray(f(t + dt, x)) - fx) / dt
+
+        k1 = SolverEDO._aplicar(M, fx + gh_ft)
+        k2 = SolverEDO._aplicar(M, np.asarray(f(t + h, x + h * k1)) - 2 * k1 - gh_ft)
+        return x + h * (1.5 * k1 + 0.5 * k2)
+
+    @staticmethod
+    def tiro(f: Callable, a: float, b: float, h: float, y0: float, yb: float, chute1: float, chute2: float, tol: float = 1e-5, max_iter: int = 100,
+             info: Optional[dict] = None, inplace: bool = False, salvar_cada: int = 1, t_saida=None,
+             arquivo_memmap: Optional[str] = None, metodo: str = 'rk4',
+             jac: Optional[Callable] = None, colunas: Optional[Callable] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Resolve uma EDO de 2ª ordem como PVI usando o método do Tiro Simples com Runge-Kutta de 4ª ordem.
 
+        Com metodo implícito ('euler_implicito', 'trbdf2' ou 'rosenbrock'), as integrações usam esse
+        método (ver SolverEDO.integrar), estável com passos grandes em problemas rígidos.
+
+        Em lote, y0, yb e os chutes são arrays de k valores (ou escalares comuns a todos) e f recebe
+        estados (2, k), uma configuração por coluna. Todas as colunas são integradas juntas, e a
+        secante só atualiza as que ainda não convergiram. Se 'colunas' for fornecido, cada iteração
+        reintegra apenas essas colunas ainda ativas.
+
+        Argumentos:
+        f (Callable): Função que retorna o sistema reescrito como EDOs de 1ª ordem (recebe t e vetor x)
+        a (float): Início do intervalo
+        b (float): Fim do intervalo
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
+        y0 (float ou np.ndarray): Condição inicial y(a)
+        yb (float ou np.ndarray): Valor esperado para y(b)
+        chute1 (float ou np.ndarray): Primeiro chute para y'(a)
+        chute2 (float ou np.ndarray): Segundo chute para y'(a)
+        tol (float): Tolerância para o critério de parada
+        max_iter (int): Número máximo de iterações
+        info (dict): Se fornecido, recebe 'iteracoes' (atualizações da secante) e 'residuo' (y(b) - yb),
+                     arrays com um valor por coluna em lote
+        inplace (bool): Se True, f tem a forma f(t, x, out) (ver SolverEDO.rk4)
+        salvar_cada, t_saida, arquivo_memmap: Saída da trajetória final (ver SolverEDO.rk4)
+        metodo (str): Integrador: 'rk4', 'euler_implicito', 'trbdf2' ou 'rosenbrock'
+        jac (Callable): Jacobiana df/dx para os métodos implícitos (se None, diferenças finitas)
+        colunas (Callable): Em lote, colunas(ativos) retorna o par (f, jac) restrito às colunas
+                            marcadas na máscara booleana ativos (k,)
+
+        Retorna:
+        (np.ndarray, np.ndarray): Vetor T e matriz solução X (com y e y'; (2, k, n) em lote)
+        """
+        if metodo == 'rk4':
+            opcoes = {'inplace': inplace}
+        elif inplace or salvar_cada != 1 or t_saida is not None or arquivo_memmap is not None:
+            raise ValueError("inplace, salvar_cada, t_saida e arquivo_memmap só estão disponíveis com metodo='rk4'")
+        else:
+            opcoes = {}
+
+        # Escalares viram arrays 0-d e lotes ficam com a mesma forma (k,): um só código para os dois casos
+        lote = any(np.ndim(v) > 0 for v in (y0, yb, chute1, chute2))
+        y0, yb, chute1, chute2 = (np.array(v, dtype=float) for v in np.broadcast_arrays(y0, yb, chute1, chute2))
+
+        # Durante a busca pela raiz só o y(b) interessa: integra guardando apenas o estado final
+        def erro_final(chute, ativos=None):
+            if ativos is None or colunas is None or not lote:
+                x0 = np.array([y0, chute])
+                return SolverEDO.integrar(f, a, b, h, x0, metodo, jac, apenas_final=True, **opcoes)[0] - yb
+
+            # Só as colunas ativas são integradas; as demais ficam NaN (descartadas pelo chamador)
+            f_ativos, jac_ativos = colunas(ativos)
+            x0 = np.array([y0[ativos], chute[ativos]])
+            erro = np.full(y0.shape, np.nan)
+            erro[ativos] = SolverEDO.integrar(f_ativos, a, b, h, x0, metodo, jac_ativos,
+                                              apenas_final=True, **opcoes)[0] - yb[ativos]
+            return erro
+
+        erro1 = erro_final(chute1)
+        erro2 = erro_final(chute2)
+
+        iteracoes = np.zeros(y0.shape, dtype=int)
+        for _ in range(max_iter):
+            ativos = np.abs(erro2) >= tol
+            if not ativos.any():
+                break
+
+            # Secante (colunas já convergidas mantêm o chute; a divisão delas pode ser 0/0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                chute3 = np.where(ativos, chute2 - erro2 * (chute2 - chute1) / (erro2 - erro1), chute2)
+            erro3 = erro_final(chute3, ativos)
+
+            # Atualiza valores para a proxima iteração (apenas nas colunas ativas)
+            chute1, erro1 = np.where(ativos, chute2, chute1), np.where(ativos, erro2, erro1)
+            chute2, erro2 = chute3, np.where(ativos, erro3, erro2)
+            iteracoes += ativos
+
+        if info is not None:
+            info['iteracoes'] = iteracoes if lote else int(iteracoes)
+            info['residuo'] = erro2 if lote else float(erro2)
+
+        # Uma única integração completa com o chute final para montar a trajetória
+        if metodo != 'rk4':
+            return SolverEDO.integrar(f, a, b, h, np.array([y0, chute2]), metodo, jac)
+        return SolverEDO.rk4(f, a, b, h, np.array([y0, chute2]), inplace, salvar_cada, t_saida, arquivo_memmap)
+
+    @staticmethod
+    def tiro_newton(f: Callable, a: float, b: float, h: float, y0: float, yb: float, chute: float,
+                    jac: Optional[Callable] = None, metodo_jac: str = 'complexo', tol: float = 1e-5,
+                    max_iter: int = 100, info: Optional[dict] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve uma EDO de 2ª ordem pelo método do Tiro com atualização de Newton.
+
+        A sensibilidade S = dx/dy'(a) é integrada junto com o estado no mesmo passe de RK4, pela
+        equação variacional dS/dt = J(t, x) S com S(a) = [0, 1]. Assim cada iteração obtém
+        dy(b)/dy'(a) = S[0](b) exatamente (a menos do erro do RK4) e a convergência é quadrática.
+
         Argumentos:
         f (Callable): Função que retorna o sistema reescrito como EDOs de 1ª ordem (recebe t e vetor x)
         a (float): Início do intervalo
         b (float): Fim do intervalo
-        h (float): Tamanho do passo
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
         y0 (float): Condição inicial y(a)
         yb (float): Valor esperado para y(b)
-        chute1 (float): Primeiro chute para y'(a)
-        chute2 (float): Segundo chute para y'(a)
+        chute (float): Chute inicial para y'(a)
+        jac (Callable): Jacobiana df/dx (recebe t e x, retorna matriz (m, m)); se None, J·S é aproximado
+        metodo_jac (str): Aproximação de J·S quando jac é None: 'complexo' (passo complexo, exige f
+                          analítica e compatível com números complexos) ou 'diferencas' (diferença central)
         tol (float): Tolerância para o critério de parada
         max_iter (int): Número máximo de iterações
+        info (dict): Se fornecido, recebe 'iteracoes' (atualizações de Newton) e 'residuo' (y(b) - yb do chute final)
+
+        Retorna:
+        (np.ndarray, np.ndarray): Vetor T e matriz solução X (com y e y')
+        """
+        if jac is None and metodo_jac not in ('complexo', 'diferencas'):
+            raise ValueError("metodo_jac deve ser 'complexo' ou 'diferencas'")
+
+        m = 2
+        f_aumentada = SolverEDO._f_variacional(f, jac, metodo_jac, m, 1)
+
+        # O resíduo é sempre avaliado para o chute final, mesmo quando max_iter se esgota
+        for iteracoes in range(max_iter + 1):
+            z_b = SolverEDO.rk4_final(f_aumentada, a, b, h, np.array([y0, chute, 0.0, 1.0]))
+            erro = z_b[0] - yb
+            if abs(erro) < tol or iteracoes == max_iter:
+                break
+
+            # Newton: y'(a) <- y'(a) - (y(b) - yb) / (dy(b)/dy'(a))
+            sensibilidade = z_b[m]
+            if sensibilidade == 0 or not np.isfinite(sensibilidade):
+                raise RuntimeError(f"tiro_newton: dy(b)/dy'(a) = {sensibilidade} com y'(a) = {chute}; "
+                                   "o passo de Newton não está definido (tente outro chute)")
+            chute = chute - erro / sensibilidade
+
+        if info is not None:
+            info['iteracoes'] = iteracoes
+            info['residuo'] = float(erro)
+
+        # Uma única integração completa com o chute final para montar a trajetória
+        return SolverEDO.rk4(f, a, b, h, np.array([y0, chute]))
+
+    @staticmethod
+    def _f_variacional(f: Callable, jac: Optional[Callable], metodo_jac: str, m: int, p: int) -> Callable:
+        """
+        Monta o lado direito do sistema aumentado z = [x, S] com dx/dt = f(t, x) e dS/dt = J(t, x) S,
+        onde S (m, p) é guardada achatada após as m componentes do estado.
+        """
+        def f_aumentada(t, z):
+            x, S = z[:m], z[m:].reshape(m, p)
+            if jac is not None:
+                JS = np.asarray(jac(t, x)) @ S
+            else:
+                JS = np.empty((m, p), dtype=np.result_type(z, float))
+                for c in range(p):
+                    if metodo_jac == 'complexo':
+                        # Passo complexo: Im f(x + iεS) / ε = J·S sem erro de cancelamento
+                        eps = 1e-20
+                        JS[:, c] = np.imag(f(t, x + 1j * eps * S[:, c])) / eps
+                    else:
+                        eps = 1e-7 * (1.0 + np.linalg.norm(x)) / max(np.linalg.norm(S[:, c]), 1e-300)
+                        JS[:, c] = (np.asarray(f(t, x + eps * S[:, c])) - np.asarray(f(t, x - eps * S[:, c]))) / (2 * eps)
+            return np.concatenate([np.asarray(f(t, x), dtype=float), JS.ravel()])
+
+        return f_aumentada
+
+    @staticmethod
+    def tiro_multiplo(f: Callable, a: float, b: float, h: float, y0: float, yb: float, chute: float,
+                      n_segmentos: int = 8, jac: Optional[Callable] = None, metodo_jac: str = 'complexo',
+                      tol: float = 1e-5, max_iter: int = 50, n_processos: Optional[int] = None,
+                      info: Optional[dict] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve uma EDO de 2ª ordem pelo método do Tiro Múltiplo com Runge-Kutta de 4ª ordem.
+
+        O intervalo é dividido em segmentos integrados de forma independente (em paralelo, num pool
+        de processos) a partir dos estados s_j no início de cada um. As incógnitas s_j são ajustadas
+        por Newton até que os segmentos se emendem e as condições de contorno sejam satisfeitas; as
+        jacobianas G_j = dφ_j/ds_j vêm das equações variacionais integradas junto com cada segmento
+        e o sistema linear, bidiagonal por blocos, é resolvido em O(n_segmentos).
+
+        Com n_processos diferente de 1, f (e jac) precisam ser serializáveis pelo pickle, isto é,
+        funções definidas no nível do módulo ou métodos de objetos serializáveis.
+
+        Argumentos:
+        f (Callable): Função que retorna o sistema reescrito como EDOs de 1ª ordem (recebe t e vetor x)
+        a (float): Início do intervalo
+        b (float): Fim do intervalo
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
+        y0 (float): Condição inicial y(a)
+        yb (float): Valor esperado para y(b)
+        chute (float): Chute inicial para y' (usado em todos os segmentos)
+        n_segmentos (int): Número de segmentos do intervalo
+        jac (Callable): Jacobiana df/dx (recebe t e x, retorna matriz (m, m)); se None, usa metodo_jac
+        metodo_jac (str): 'complexo' ou 'diferencas' (ver SolverEDO.tiro_newton)
+        tol (float): Tolerância para os resíduos de emenda e de contorno
+        max_iter (int): Número máximo de iterações de Newton
+        n_processos (int): Processos do pool (None usa todos os núcleos, 1 integra em série)
+        info (dict): Se fornecido, recebe 'iteracoes' (atualizações de Newton) e 'residuo' (maior resíduo
+                     de emenda ou de contorno da trajetória retornada)
+
+        Retorna:
+        (np.ndarray, np.ndarray): Vetor T e matriz solução X (com y e y')
+        """
+        m = 2
+        T, h = SolverEDO.malha(a, b, h)
+
+        # Índices da malha onde cada segmento começa (o último valor é o fim do intervalo)
+        n_segmentos = max(1, min(n_segmentos, len(T) - 1))
+        limites = np.linspace(0, len(T) - 1, n_segmentos + 1).round().astype(int)
+
+        # Chute inicial: y na reta entre as condições de contorno e y' = chute em todos os segmentos
+        S = np.zeros((n_segmentos, m))
+        S[:, 0] = y0 + (yb - y0) * (T[limites[:-1]] - a) / (T[-1] - a)
+        S[:, 1] = chute
+
+        # Incógnitas: s_0, ..., s_{N-1} (m cada). Equações: y(a) = y0, emendas φ_j(s_j) = s_{j+1}, y(b) = yb
+        N = n_segmentos * m
+
+        # A jacobiana é guardada só pela banda (m diagonais abaixo e m - 1 acima da principal):
+        # banda[i, m + c - i] = A[i, c]
+        kl, ku = m, m - 1
+
+        def tarefas():
+            return [(f, jac, metodo_jac, T[limites[j]], h, limites[j + 1] - limites[j], S[j])
+                    for j in range(n_segmentos)]
+
+        # Importado aqui: concurrent.futures.process (multiprocessing) pesa na inicialização de quem só integra
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=n_processos) if n_processos != 1 else None
+        try:
+            mapear = executor.map if executor is not None else map
+            # Os resíduos são sempre avaliados para o S final, mesmo quando max_iter se esgota
+            for iteracoes in range(max_iter + 1):
+                resultados = list(mapear(_integrar_segmento, tarefas()))
+
+                F = np.zeros(N)
+                banda = np.zeros((N, kl + ku + 1))
+                F[0] = S[0, 0] - y0
+                banda[0, kl] = 1.0
+                for j, (phi, G) in enumerate(resultados[:-1]):
+                    F[1 + j * m:1 + (j + 1) * m] = phi - S[j + 1]
+                    for r in range(m):
+                        # Linha 1 + j m + r: G_j nas colunas j m.. e -1 na coluna (j + 1) m + r
+                        banda[1 + j * m + r, kl - 1 - r:kl - 1 - r + m] = G[r]
+                        banda[1 + j * m + r, kl + m - 1] = -1.0
+                phi, G = resultados[-1]
+                F[-1] = phi[0] - yb
+                banda[-1, kl - m + 1:kl + 1] = G[0]
+
+                residuo = np.max(np.abs(F))
+                if residuo < tol or iteracoes == max_iter:
+                    break
+
+                # Passo de Newton com eliminação restrita à banda: O(n_segmentos)
+                S = S + _resolver_banda(banda, -F, kl, ku).reshape(n_segmentos, m)
+
+            # Trajetória final: cada segmento integrado com rk4 a partir do s_j convergido
+            trechos = list(mapear(_trajetoria_segmento, tarefas()))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if info is not None:
+            info['iteracoes'] = iteracoes
+            info['residuo'] = float(residuo)
+
+        X = np.zeros((m, len(T)))
+        X[:, 0] = S[0]
+        for j, trecho in enumerate(trechos):
+            X[:, limites[j] + 1:limites[j + 1] + 1] = trecho
+
+        return T, X
+
+    @staticmethod
+    def diferencas_finitas(g: Callable, a: float, b: float, h: float, y0: float, yb: float,
+                           dg: Optional[Callable] = None, y_inicial=None, tol: float = 1e-10,
+                           max_iter: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve o PVC y'' = g(x, y, y'), y(a) = y0, y(b) = yb, por diferenças finitas centrais O(h²).
+
+        Todas as incógnitas y_1, ..., y_{n-2} da malha são resolvidas de uma vez: as equações
+        (y_{i+1} - 2y_i + y_{i-1}) / h² = g(x_i, y_i, (y_{i+1} - y_{i-1}) / 2h) formam um sistema não
+        linear cuja jacobiana é tridiagonal, resolvido por Newton com o algoritmo de Thomas em O(n)
+        por iteração. Não há integrações de PVI repetidas como no método do tiro.
+
+        Argumentos:
+        g (Callable): Lado direito da EDO, vetorizado (recebe arrays x, y e y')
+        a (float): Início do intervalo
+        b (float): Fim do intervalo
+        h (float): Tamanho do passo (o passo usado é (b - a) / round((b - a) / h), ver SolverEDO.malha)
+        y0 (float): Condição de contorno y(a)
+        yb (float): Condição de contorno y(b)
+        dg (Callable): Derivadas parciais de g (recebe x, y e y', retorna (dg/dy, dg/dy')); se None,
+                       são aproximadas por diferenças centrais
+        y_inicial (np.ndarray): Chute inicial para y na malha (se None, a reta entre os contornos)
+        tol (float): Tolerância para a maior correção de Newton
+        max_iter (int): Número máximo de iterações de Newton
 
         Retorna:
         (np.ndarray, np.ndarray): Vetor T e matriz solução X (com y e y')
         """
-        
-        x0_1 = np.array([y0, chute1])
-        _, X1 = SolverEDO.rk4(f, a, b, h, x0_1)
-        erro1 = X1[0, -1] - yb
+        T, h = SolverEDO.malha(a, b, h)
+        n = len(T)
 
-        x0_2 = np.array([y0, chute2])
-        T, X2 = SolverEDO.rk4(f, a, b, h, x0_2)
-        erro2 = X2[0, -1] - yb
+        if y_inicial is None:
+            y = y0 + (yb - y0) * (T - a) / (T[-1] - a)
+        else:
+            y = np.array(y_inicial, dtype=float)
+        y[0], y[-1] = y0, yb
 
+        x_int = T[1:-1]
         for _ in range(max_iter):
-            if abs(erro2) < tol:
-                return T, X2
+            dy = (y[2:] - y[:-2]) / (2 * h)
+            F = (y[2:] - 2 * y[1:-1] + y[:-2]) / h**2 - g(x_int, y[1:-1], dy)
+
+            if dg is not None:
+                g_y, g_p = dg(x_int, y[1:-1], dy)
+            else:
+                eps_y = 1e-7 * (1.0 + np.abs(y[1:-1]))
+                eps_p = 1e-7 * (1.0 + np.abs(dy))
+                g_y = (g(x_int, y[1:-1] + eps_y, dy) - g(x_int, y[1:-1] - eps_y, dy)) / (2 * eps_y)
+                g_p = (g(x_int, y[1:-1], dy + eps_p) - g(x_int, y[1:-1], dy - eps_p)) / (2 * eps_p)
+
+            # Diagonais da jacobiana dF/dy (apenas nas incógnitas internas)
+            inferior = 1 / h**2 + g_p / (2 * h) * np.ones(n - 2)
+            principal = -2 / h**2 - g_y * np.ones(n - 2)
+            superior = 1 / h**2 - g_p / (2 * h) * np.ones(n - 2)
+
+            delta = _resolver_tridiagonal(inferior[1:], principal, superior[:-1], -F)
+            y[1:-1] += delta
+
+            if np.max(np.abs(delta)) < tol:
+                break
+
+        # y' na malha por diferenças de 2ª ordem (centrais no interior, laterais nos extremos)
+        X = np.vstack([y, np.gradient(y, h, edge_order=2)])
+        return T, X
+
+
+def _integrar_segmento(tarefa) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integra um segmento do tiro múltiplo com as equações variacionais (executado nos processos do pool).
+
+    Retorna o estado no fim do segmento e a jacobiana (m, m) dele em relação ao estado inicial.
+    """
+    f, jac, metodo_jac, t0, h, n_passos, s = tarefa
+    m = len(s)
+    f_aumentada = SolverEDO._f_variacional(f, jac, metodo_jac, m, m)
+
+    z = np.concatenate([s, np.eye(m).ravel()])
+    for i in range(n_passos):
+        z = SolverEDO._passo_rk4(f_aumentada, t0 + i * h, z, h)
+
+    return z[:m], z[m:].reshape(m, m)
 
-            # Secante 
-            chute3 = chute2 - erro2 * (chute2 - chute1) / (erro2 - erro1)
 
-            x0_3 = np.array([y0, chute3])
-            T, X3 = SolverEDO.rk4(f, a, b, h, x0_3)
-            erro3 = X3[0, -1] - yb 
+def _trajetoria_segmento(tarefa) -> np.ndarray:
+    """Integra um segmento do tiro múltiplo e retorna os estados (m, n_passos) após cada passo"""
+    f, _, _, t0, h, n_passos, s = tarefa
+    x = np.asarray(s, dtype=float)
+    X = np.zeros((len(x), n_passos))
+    for i in range(n_passos):
+        x = SolverEDO._passo_rk4(f, t0 + i * h, x, h)
+        X[:, i] = x
+    return X
+
+
+def _resolver_banda(banda: np.ndarray, rhs: np.ndarray, kl: int, ku: int) -> np.ndarray:
+    """
+    Resolve A x = rhs por eliminação gaussiana com pivoteamento parcial restrita à banda de A
+    (kl diagonais abaixo e ku acima da principal). O custo é O(n kl (kl + ku)).
+
+    A é dada só pela banda, uma linha por equação: banda[i, kl + c - i] = A[i, c] (n x (kl + ku + 1)).
+    """
+    n = len(rhs)
+    rhs = rhs.astype(float)
+
+    # O pivoteamento pode alargar a banda superior em até kl diagonais: colunas extras à direita
+    B = np.zeros((n, 2 * kl + ku + 1))
+    B[:, :kl + ku + 1] = banda
+    ku = ku + kl
+
+    for k in range(n - 1):
+        fim_l = min(n, k + kl + 1)
+        largura = min(n, k + ku + 1) - k    # Colunas k, ..., k + largura - 1
+
+        # Pivoteamento parcial entre as linhas da banda (a coluna k da linha r fica em B[r, kl + k - r])
+        linhas = np.arange(k, fim_l)
+        p = k + np.argmax(np.abs(B[linhas, kl + k - linhas]))
+        if p != k:
+            pivo = B[p, kl + k - p:kl + k - p + largura].copy()
+            B[p, kl + k - p:kl + k - p + largura] = B[k, kl:kl + largura]
+            B[k, kl:kl + largura] = pivo
+            rhs[[k, p]] = rhs[[p, k]]
+
+        pivo = B[k, kl:kl + largura]
+        for r in range(k + 1, fim_l):
+            inicio = kl + k - r
+            fator = B[r, inicio] / pivo[0]
+            B[r, inicio:inicio + largura] -= fator * pivo
+            rhs[r] -= fator * rhs[k]
+
+    # Substituição regressiva
+    x = np.zeros(n)
+    for k in range(n - 1, -1, -1):
+        fim_c = min(n, k + ku + 1)
+        x[k] = (rhs[k] - B[k, kl + 1:kl + fim_c - k] @ x[k + 1:fim_c]) / B[k, kl]
+
+    return x
+
+
+def _resolver_tridiagonal(inferior: np.ndarray, principal: np.ndarray, superior: np.ndarray,
+                          rhs: np.ndarray) -> np.ndarray:
+    """
+    Resolve um sistema tridiagonal pelo algoritmo de Thomas em O(n).
+
+    inferior e superior têm n - 1 elementos (abaixo e acima da diagonal principal).
+    """
+    n = len(principal)
+    c = np.zeros(n - 1)
+    d = np.zeros(n)
 
-            # Atualiza valores para a proxima iteração  
-            chute1, erro1 = chute2, erro2
-            chute2, erro2 = chute3, erro3 
-            X2 = X3
+    # Eliminação progressiva
+    c[0] = superior[0] / principal[0] if n > 1 else 0.0
+    d[0] = rhs[0] / principal[0]
+    for i in range(1, n):
+        denominador = principal[i] - inferior[i - 1] * c[i - 1]
+        if i < n - 1:
+            c[i] = superior[i] / denominador
+        d[i] = (rhs[i] - inferior[i - 1] * d[i - 1]) / denominador
 
-        return T, X2
+    # Substituição regressiva
+    x = d
+    for i in range(n - 2, -1, -1):
+        x[i] -= c[i] * x[i + 1]
 
+    return x
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+"""
+Varredura de parâmetros do problema do cabo suspenso
+
+Resolve o PVC para todas as combinações de C, b, y0 e yb, distribuindo as resoluções em lotes
+entre os processos de um pool, e reúne os resultados em um array estruturado (colunar).
+"""
+
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from cabo import ProblemaCabo
+from solvers_edo import SolverEDO
+
+# Colunas do resultado da varredura
+CAMPOS = np.dtype([
+    ('C', 'f8'),
+    ('b', 'f8'),
+    ('y0', 'f8'),
+    ('yb', 'f8'),
+    ('flecha', 'f8'),           # Maior distância vertical entre a corda e o cabo
+    ('inclinacao_a', 'f8'),     # y'(a)
+    ('inclinacao_b', 'f8'),     # y'(b)
+    ('erro_contorno', 'f8'),    # |y(b) - yb|
+    ('convergiu', '?'),         # erro_contorno abaixo da tolerância do Tiro
+])
+
+Valores = Union[float, Sequence[float], np.ndarray]
+
+
+def varrer_parametros(C: Valores, b: Valores, y0: Valores, yb: Valores, base: Optional[ProblemaCabo] = None,
+                      n_processos: Optional[int] = None, tamanho_lote: Optional[int] = None,
+                      arquivo_npz: Optional[str] = None) -> np.ndarray:
+    """
+    Resolve o problema do cabo para a grade (produto cartesiano) de C, b, y0 e yb.
+
+    Os chutes do método do Tiro são tirados da inclinação da corda de cada configuração
+    (corda - 1 e corda + 1); os demais parâmetros (a, h, tolerância, integrador...) vêm de 'base'.
+
+    Argumentos:
+    C, b, y0, yb (float ou sequência): Valores de cada parâmetro
+    base (ProblemaCabo): Problema com os demais parâmetros (padrão: os do enunciado)
+    n_processos (int): Processos do pool (None usa todos os núcleos, 1 resolve em série)
+    tamanho_lote (int): Configurações por tarefa do pool (padrão: ~4 lotes por processo)
+    arquivo_npz (str): Se fornecido, salva as colunas do resultado nesse arquivo .npz
+
+    Retorna:
+    np.ndarray: Array estruturado com dtype CAMPOS, uma linha por configuração, na ordem da grade
+    """
+    base = base if base is not None else ProblemaCabo()
+    grade = itertools.product(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (C, b, y0, yb)))
+    problemas = [replace(base, C=c, b=b_, y0=y0_, yb=yb_,
+                         chute1=(yb_ - y0_) / (b_ - base.a) - 1, chute2=(yb_ - y0_) / (b_ - base.a) + 1)
+                 for c, b_, y0_, yb_ in grade]
+
+    if n_processos == 1:
+        resultado = _resolver_lote(problemas)
+    else:
+        n_processos = n_processos or os.cpu_count() or 1
+        if tamanho_lote is None:
+            tamanho_lote = max(1, math.ceil(len(problemas) / (4 * n_processos)))
+        with ProcessPoolExecutor(max_workers=n_processos) as executor:
+            lotes = [problemas[i:i + tamanho_lote] for i in range(0, len(problemas), tamanho_lote)]
+            resultado = np.concatenate(list(executor.map(_resolver_lote, lotes)))
+
+    if arquivo_npz is not None:
+        np.savez(arquivo_npz, **{campo: resultado[campo] for campo in CAMPOS.names})
+
+    return resultado
+
+
+def _resolver_lote(problemas: List[ProblemaCabo]) -> np.ndarray:
+    """
+    Resolve um lote de configurações (executado nos processos do pool).
+
+    Configurações com a mesma malha (a, b, h) e o mesmo integrador são resolvidas juntas: o método
+    do Tiro (secante) avança todas ao mesmo tempo, com o integrador em lote tratando os estados
+    como colunas, e cada iteração reintegra só as configurações que ainda não convergiram.
+    """
+    linhas = np.zeros(len(problemas), dtype=CAMPOS)
+
+    grupos = {}
+    for i, p in enumerate(problemas):
+        grupos.setdefault((p.a, p.b, p.h, p.tol, p.max_iter, p.metodo), []).append(i)
+
+    for (a, b, h, tol, max_iter, metodo), indices in grupos.items():
+        C = np.array([problemas[i].C for i in indices])
+        y0 = np.array([problemas[i].y0 for i in indices])
+        yb = np.array([problemas[i].yb for i in indices])
+        chute1 = np.array([problemas[i].chute1 for i in indices])
+        chute2 = np.array([problemas[i].chute2 for i in indices])
+
+        T, X = SolverEDO.tiro(_f_lote(C), a, b, h, y0, yb, chute1, chute2, tol=tol, max_iter=max_iter,
+                              metodo=metodo, jac=_jac_lote(C),
+                              colunas=lambda ativos, C=C: (_f_lote(C[ativos]), _jac_lote(C[ativos])))
+
+        y = X[0]
+        corda = y[:, :1] + (y[:, -1:] - y[:, :1]) * (T - T[0]) / (T[-1] - T[0])
+        erro = np.abs(y[:, -1] - yb)
+
+        linhas[indices] = list(zip(C, [b] * len(indices), y0, yb, np.max(corda - y, axis=1),
+                                   X[1, :, 0], X[1, :, -1], erro, erro < tol))
+
+    return linhas
+
+
+def _f_lote(C: np.ndarray):
+    """Lado direito do cabo com um C por coluna do lote de estados (2, k)"""
+    def f(t, x):
+        w = x[1]
+        return np.array([w, C * np.sqrt(1.0 + w**2)])
+    return f
+
+
+def _jac_lote(C: np.ndarray):
+    """Jacobiana (2, 2, k) de _f_lote(C), uma por coluna do lote (como ProblemaCabo.jac)"""
+    def jac(t, x):
+        w = x[1]
+        zero = np.zeros_like(w)
+        return np.array([[zero, zero + 1.0], [zero, C * w / np.sqrt(1.0 + w**2)]])
+    return jac
+
+
+if __name__ == "__main__":
+    inicio = time.perf_counter()
+    resultado = varrer_parametros(C=np.linspace(0.02, 0.06, 5), b=[15, 20, 25], y0=15, yb=[5, 10])
+    duracao = time.perf_counter() - inicio
+
+    print(f"{len(resultado)} configuracoes resolvidas em {duracao:.2f} s ({len(resultado) / duracao:.1f} resolucoes/s)")
+    print("   C       b     y0    yb    flecha   y'(a)     y'(b)     erro")
+    for linha in resultado:
+        print(f"  {linha['C']:.3f}  {linha['b']:4.0f}  {linha['y0']:4.0f}  {linha['yb']:4.0f}  {linha['flecha']:7.4f}"
+              f"  {linha['inclinacao_a']:8.4f}  {linha['inclinacao_b']:8.4f}  {linha['erro_contorno']:.1e}")